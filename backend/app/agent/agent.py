@@ -2,35 +2,63 @@
 
 import concurrent.futures
 import logging
+from collections import deque
 from typing import Callable, Optional, Iterator
 
 from app.agent.ai_client import AIClient, DEFAULT_MODEL, FAST_MODEL
 from app.agent.graph import build_agent_graph
-from app.agent.models import ConversationState, Phase
+from app.agent.models import ConversationState, InitialExtraction, Phase
 from app.agent.phases import (
     clarification,
     feasibility,
     planning,
     refinement,
 )
+from app.agent.phases.assumptions import SpeculativeAssumptions
 from app.agent.image_search import search_destination_images
 from app.agent.flight_search import search_flight_costs
 
 logger = logging.getLogger(__name__)
 
-# Background executor for image search
-_img_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+# Research history kept for prompt context (planning reads at most the last 5)
+MAX_SEARCH_RESULTS = 5
+
+# Background executor for image search, flight search and research prefetch
+_img_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
 
 
 class TravelAgent:
     """Orchestrates the constraint-first travel planning conversation."""
 
+    # One agent lives per planning session; slots keep the per-session
+    # footprint small and make attribute typos fail loudly.
+    __slots__ = (
+        "client",
+        "fast_client",
+        "state",
+        "on_search",
+        "search_results",
+        "user_interests",
+        "_initial_extraction",
+        "on_status",
+        "_last_status",
+        "language_code",
+        "destination_images",
+        "_image_search_future",
+        "_flight_search_future",
+        "_flight_costs",
+        "_research_future",
+        "_research_period",
+        "_speculative_assumptions",
+        "_graph",
+    )
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         model: str = DEFAULT_MODEL,
         fast_model: Optional[str] = FAST_MODEL,
-            on_search: Optional[Callable[[str], None]] = None,
+        on_search: Optional[Callable[[str], None]] = None,
         on_status: Optional[Callable[[str], None]] = None,
         language_code: Optional[str] = None,
         vibe: Optional[str] = None,
@@ -53,9 +81,12 @@ class TravelAgent:
         if vibe:
             self.state.vibe = vibe
         self.on_search = on_search
-        self.search_results: list[str] = []  # Store search results for context
-        self.user_interests: list[str] = []  # Store user interests/adjustments
-        self._initial_extraction = None
+        # Bounded so long sessions don't grow without limit; planning only
+        # ever reads the most recent few entries.
+        self.search_results: deque[str] = deque(maxlen=MAX_SEARCH_RESULTS)
+        # Kept in full: every stated preference goes into the plan prompt
+        self.user_interests: list[str] = []
+        self._initial_extraction: Optional[InitialExtraction] = None
         self.on_status = on_status
         self._last_status: Optional[str] = None
         self.language_code = language_code  # Store user's preferred language
@@ -63,6 +94,10 @@ class TravelAgent:
         self._image_search_future: Optional[concurrent.futures.Future] = None
         self._flight_search_future: Optional[concurrent.futures.Future] = None
         self._flight_costs: str = ""
+        self._research_future: Optional[concurrent.futures.Future] = None
+        self._research_period: Optional[str] = None
+        # Assumptions generated during the clarify turn, used on proceed
+        self._speculative_assumptions: Optional[SpeculativeAssumptions] = None
         self._graph = build_agent_graph(
             self.client, self.fast_client, self._handle_tool_call, language_code
         )
@@ -78,12 +113,14 @@ class TravelAgent:
             "response": "",
             "has_high_risk": False,
             "language_code": self.language_code,
+            "speculative_assumptions": self._speculative_assumptions,
         }
         result = self._graph.invoke(state)
         self.state = result["agent_state"]
         self.search_results = result["search_results"]
         self.user_interests = result["user_interests"]
         self._initial_extraction = result.get("initial_extraction")
+        self._speculative_assumptions = result.get("speculative_assumptions")
         return result
 
     def _emit_status(self, message: str) -> None:
@@ -129,6 +166,22 @@ class TravelAgent:
             search_flight_costs, origin, destination, date_context
         )
 
+    def _start_flight_search_from_constraints(self) -> None:
+        """Start the flight search once clarification has filled in the trip."""
+        # After clarification, check for origin/dest in constraints or extraction
+        origin = self.state.origin or (self.state.constraints and self.state.constraints.origin)
+        destination = self.state.destination or (self.state.constraints and self.state.constraints.destination)
+
+        if origin and destination:
+            # Get date context
+            date_ctx = None
+            if self.state.constraints and self.state.constraints.month_or_season:
+                date_ctx = self.state.constraints.month_or_season
+            elif self._initial_extraction and self._initial_extraction.month_or_season:
+                date_ctx = self._initial_extraction.month_or_season
+
+            self._start_flight_search(origin, destination, date_ctx)
+
     def get_flight_costs(self) -> str:
         """Get cached flight costs, waiting up to 6s if search is still running."""
         if self._flight_costs:
@@ -142,6 +195,32 @@ class TravelAgent:
             self._flight_costs = ""
         return self._flight_costs
 
+    def _start_research_prefetch(
+        self, destination: str, period: str | None = None
+    ) -> None:
+        """Kick off destination-level feasibility searches in the background.
+
+        Overlaps the advisory/weather lookups with the time the user spends
+        answering the clarification questions.
+        """
+        if self._research_future is not None or not destination:
+            return
+        logger.info(f"[AGENT] Prefetching feasibility research for: {destination}")
+        self._research_period = period
+        self._research_future = _img_executor.submit(
+            feasibility.prefetch_destination_research, destination, period
+        )
+
+    def get_prefetched_research(self) -> str:
+        """Get prefetched feasibility research, waiting up to 8s if still running."""
+        if self._research_future is None:
+            return ""
+        try:
+            return self._research_future.result(timeout=8)
+        except Exception as e:
+            logger.warning(f"[AGENT] Research prefetch failed/timeout: {e}")
+            return ""
+
     def _handle_tool_call(self, tool_name: str, arguments: dict) -> None:
         """Handle tool call notifications."""
         if tool_name == "web_search" and self.on_search:
@@ -180,15 +259,26 @@ class TravelAgent:
             Clarification questions for missing info, or request for origin/destination.
         """
         result = self._run_graph("start", {"prompt": user_prompt})
+        self._start_background_searches()
+        return result["response"]
+
+    def _start_background_searches(self) -> None:
+        """Start image, research and flight searches for the extracted trip.
+
+        Runs while the user reads and answers the clarification questions.
+        """
+        period = (
+            self._initial_extraction.month_or_season
+            if self._initial_extraction
+            else None
+        )
         # Kick off background image search if destination was extracted
         if self.state.destination:
             self._start_image_search(self.state.destination)
+            self._start_research_prefetch(self.state.destination, period)
         # Kick off flight search if origin and destination are known
         if self.state.origin and self.state.destination:
-            # Try to get date context from extraction, or default to generic
-            date_ctx = self._initial_extraction.month_or_season if self._initial_extraction else None
-            self._start_flight_search(self.state.origin, self.state.destination, date_ctx)
-        return result["response"]
+            self._start_flight_search(self.state.origin, self.state.destination, period)
 
     def process_clarification(self, answers: str) -> tuple[str, bool]:
         """Process user's answers to clarification questions.
@@ -201,7 +291,15 @@ class TravelAgent:
         Returns:
             Tuple of (response text, has_high_risk).
         """
-        result = self._run_graph("clarify", {"answers": answers})
+        result = self._run_graph(
+            "clarify",
+            {
+                "answers": answers,
+                "prefetched_research": self.get_prefetched_research(),
+                "prefetched_period": self._research_period,
+            },
+        )
+        self._start_flight_search_from_constraints()
         return result["response"], bool(result.get("has_high_risk"))
 
     def confirm_proceed(self, proceed: bool) -> str:
@@ -255,6 +353,7 @@ class TravelAgent:
                 "confirmed": confirmed,
                 "modifications": modifications or adjustments,
                 "additional_interests": additional_interests,
+                "get_flight_costs": self.get_flight_costs,
             },
         )
         return result["response"]
@@ -266,7 +365,10 @@ class TravelAgent:
             Day-by-day travel plan.
         """
         self._emit_status("Researching current prices...")
-        result = self._run_graph("assumptions", {"confirmed": True})
+        result = self._run_graph(
+            "assumptions",
+            {"confirmed": True, "get_flight_costs": self.get_flight_costs},
+        )
         return result["response"]
 
     def refine_plan(self, refinement_type: str) -> str:
@@ -286,22 +388,20 @@ class TravelAgent:
     def start_stream(self, user_prompt: str) -> Iterator[str]:
         """Start a new trip planning conversation with token streaming."""
         self._emit_status("Understanding your request...")
-        stream = clarification.handle_start_stream(
-            self.client, self.state, user_prompt, self.language_code
+
+        def on_extracted(extracted: Optional[InitialExtraction]) -> None:
+            # Start searching before the questions stream, with the travel
+            # period from the extraction
+            self._initial_extraction = extracted
+            self._start_background_searches()
+
+        yield from clarification.handle_start_stream(
+            self.client,
+            self.state,
+            user_prompt,
+            self.language_code,
+            on_extracted=on_extracted,
         )
-        started = False
-        for token in stream:
-            yield token
-            # After first token, destination should be extracted — start image search
-            if not started:
-                if self.state.destination:
-                    self._start_image_search(self.state.destination)
-                
-                # Also start flight search if we happen to have origin immediately
-                if self.state.origin and self.state.destination:
-                    date_ctx = self._initial_extraction.month_or_season if self._initial_extraction else None
-                    self._start_flight_search(self.state.origin, self.state.destination, date_ctx)
-                started = True
 
     def process_clarification_stream(self, answers: str) -> Iterator[str]:
         """Process clarification answers with token streaming."""
@@ -313,23 +413,12 @@ class TravelAgent:
             self._initial_extraction,
             self.language_code,
             search_results=self.search_results,
+            prefetched_research=self.get_prefetched_research(),
+            prefetched_period=self._research_period,
         )
         for token in stream:
             yield token
-        
-        # After clarification, check for origin/dest in constraints or extraction
-        origin = self.state.origin or (self.state.constraints and self.state.constraints.origin)
-        destination = self.state.destination or (self.state.constraints and self.state.constraints.destination)
-        
-        if origin and destination:
-            # Get date context
-            date_ctx = None
-            if self.state.constraints and self.state.constraints.month_or_season:
-                date_ctx = self.state.constraints.month_or_season
-            elif self._initial_extraction and self._initial_extraction.month_or_season:
-                date_ctx = self._initial_extraction.month_or_season
-            
-            self._start_flight_search(origin, destination, date_ctx)
+        self._start_flight_search_from_constraints()
 
     def confirm_proceed_stream(self, proceed: bool) -> Iterator[str]:
         """Handle proceed decision with token streaming."""
@@ -3,15 +3,23 @@
 Uses OpenRouter as the provider, which is OpenAI-compatible.
 """
 
+import concurrent.futures
+import hashlib
 import json
 import logging
 import os
+import random
+import threading
 import time
+from functools import lru_cache
 from typing import Any, Callable, Optional, Type, TypeVar
 
+import httpx
+import orjson
 from openai import OpenAI, RateLimitError
 from pydantic import BaseModel
 
+from app.cache import llm_cache
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -23,11 +31,172 @@ settings = get_settings()
 # Default: Gemini 3 Flash for the hackathon. Tool calling is disabled via fallback.
 DEFAULT_MODEL = os.environ.get("OPENROUTER_MODEL", settings.openrouter_model)
 FAST_MODEL = os.environ.get("OPENROUTER_MODEL_FAST", settings.openrouter_model_fast)
+# Cheaper model for JSON extraction/structuring steps (falls back to FAST_MODEL)
+EXTRACTION_MODEL = os.environ.get(
+    "OPENROUTER_MODEL_EXTRACTION", settings.openrouter_model_extraction or FAST_MODEL
+)
+
+# One pooled HTTP/2 client shared by every AIClient, so agents created per
+# request reuse warm connections to OpenRouter instead of new TLS handshakes.
+_http_client = httpx.Client(
+    http2=True,
+    timeout=httpx.Timeout(120.0, connect=10.0),
+    # Keep every pooled connection alive: with a smaller keep-alive cap,
+    # bursts of concurrent agents close and re-handshake the overflow.
+    limits=httpx.Limits(
+        max_connections=100, max_keepalive_connections=100, keepalive_expiry=60.0
+    ),
+)
+# Re-warm interval while idle; below keepalive_expiry so the pooled
+# connection never expires between user requests.
+HTTP_WARM_UP_INTERVAL = 45.0
+
+
+def warm_up_http_client() -> None:
+    """Open a pooled connection to OpenRouter ahead of the first LLM call.
+
+    DNS, TCP, TLS and HTTP/2 setup otherwise land on the first user's
+    time-to-first-token. Any response will do; failures are ignored.
+    """
+    try:
+        _http_client.head(OPENROUTER_BASE_URL, timeout=5.0)
+    except httpx.HTTPError as e:
+        logger.warning(f"OpenRouter connection warm-up failed: {e}")
+
+
+@lru_cache(maxsize=8)
+def _openai_client(api_key: str) -> OpenAI:
+    """Shared SDK client per API key; every agent's AIClients reuse it."""
+    return OpenAI(
+        api_key=api_key,
+        base_url=OPENROUTER_BASE_URL,
+        http_client=_http_client,
+    )
+
+
+def close_http_client() -> None:
+    """Close the shared HTTP client (called on application shutdown)."""
+    _http_client.close()
+
+
+# Only near-deterministic calls are worth caching; higher temperatures are
+# expected to vary between runs.
+LLM_CACHE_MAX_TEMPERATURE = 0.5
+LLM_CACHE_TTL = 86400  # 24 hours
+
+# Client-side cap on in-flight completion requests across every AIClient, so
+# bursts of concurrent trips queue here instead of tripping upstream 429s.
+MAX_LLM_CONCURRENCY = int(os.environ.get("OPENROUTER_MAX_CONCURRENCY", "16"))
+_llm_slots = threading.BoundedSemaphore(MAX_LLM_CONCURRENCY)
+# Upper bound for honouring a server-provided Retry-After
+MAX_RATE_LIMIT_WAIT = 30.0
+
+
+def _retry_after(err: RateLimitError) -> Optional[float]:
+    """Seconds the provider asked us to wait, if it sent a Retry-After header."""
+    value = err.response.headers.get("retry-after") if err.response else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _strip_code_fence(content: str) -> str:
+    """Remove a ```json ... ``` wrapper some models add even in JSON mode.
+
+    Parsing the payload inside the fence avoids a validation-error retry
+    round-trip for an otherwise valid response.
+    """
+    text = content.strip()
+    if not text.startswith("```"):
+        return content
+    text = text.split("\n", 1)[1] if "\n" in text else ""
+    if text.rstrip().endswith("```"):
+        text = text.rstrip()[:-3]
+    return text.strip()
+
+
+def _with_research_results(messages: list[dict], results: list[str]) -> list[dict]:
+    """Return messages plus a system message carrying tool results, if any.
+
+    Builds a new list only when there is something to add, leaving the
+    caller's list untouched either way.
+    """
+    if not results:
+        return messages
+    return [
+        *messages,
+        {"role": "system", "content": "Research results:\n" + "\n\n".join(results)},
+    ]
+
+
+# Upper bound on concurrent tool calls (web searches) within one batch
+MAX_TOOL_CONCURRENCY = 5
+# Budget for a batch of parallel tool calls, measured from dispatch
+TOOL_BATCH_TIMEOUT = 20.0
+
+
+def execute_tools_parallel(
+    tool_executor: Callable[[str, dict[str, Any]], str],
+    calls: list[tuple[str, dict[str, Any]]],
+    on_tool_call: Optional[Callable[[str, dict], None]] = None,
+) -> list[str]:
+    """Run independent tool calls concurrently, preserving input order.
+
+    Tool calls are I/O-bound (web searches), so dispatching them together
+    turns N sequential round-trips into roughly one. The on_tool_call
+    notifications run only after every call is dispatched, so a slow or
+    failing UI callback never delays or aborts the searches. A call that
+    raises yields a JSON error result instead of discarding the results of
+    the calls that succeeded.
+
+    Each batch gets its own small pool, so its calls never queue behind
+    other sessions' searches and TOOL_BATCH_TIMEOUT measures only their
+    own work. Calls still pending at the deadline are cancelled and
+    reported as timed out; a call already running can't be interrupted and
+    finishes in the background, with the result discarded.
+    """
+    if not calls:
+        return []
+    deadline = time.monotonic() + TOOL_BATCH_TIMEOUT
+    pool = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(calls), MAX_TOOL_CONCURRENCY),
+        thread_name_prefix="tool-call",
+    )
+    try:
+        futures = [pool.submit(tool_executor, name, args) for name, args in calls]
+        if on_tool_call:
+            for name, args in calls:
+                try:
+                    on_tool_call(name, args)
+                except Exception:
+                    logger.exception("on_tool_call callback failed for %s", name)
+
+        results: list[str] = []
+        for (name, _), future in zip(calls, futures):
+            try:
+                results.append(
+                    future.result(timeout=max(0.0, deadline - time.monotonic()))
+                )
+            except concurrent.futures.TimeoutError:
+                # Don't hold the whole turn hostage to one stuck search
+                future.cancel()
+                logger.warning("Tool call %s timed out", name)
+                results.append(json.dumps({"error": f"{name} timed out"}))
+            except Exception as e:
+                logger.exception("Tool call %s failed", name)
+                results.append(json.dumps({"error": f"{name} failed: {e}"}))
+        return results
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 class AIClient:
     """Wrapper for OpenRouter (OpenAI-compatible) API with structured output parsing."""
 
+    # (response model, include_schema, include_example) -> instruction text
+    _instruction_cache: dict[tuple, str] = {}
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -45,30 +214,57 @@ class AIClient:
                 "OpenRouter API key is required. Set OPENROUTER_API_KEY environment "
                 "variable or pass api_key parameter."
             )
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=OPENROUTER_BASE_URL,
-        )
+        self.client = _openai_client(self.api_key)
         self.model = model or DEFAULT_MODEL
 
     def _create_completion_with_retry(self, **kwargs):
         last_error: Exception | None = None
-        for attempt in range(3):
+        attempts = 3
+        for attempt in range(attempts):
             try:
-                return self.client.chat.completions.create(**kwargs)
+                with _llm_slots:
+                    return self.client.chat.completions.create(**kwargs)
             except RateLimitError as err:
                 last_error = err
-                # Exponential backoff for upstream rate limits.
-                time.sleep(1.5 * (2**attempt))
+                if attempt == attempts - 1:
+                    break
+                # Prefer the provider's Retry-After, else exponential backoff;
+                # jitter keeps concurrent callers from retrying in lockstep.
+                delay = _retry_after(err) or 1.5 * (2**attempt)
+                time.sleep(min(delay, MAX_RATE_LIMIT_WAIT) + random.uniform(0, 0.5))
         if last_error:
             raise last_error
         raise RateLimitError("Upstream rate limit")
 
+    def _cache_key(
+        self,
+        messages: list[dict],
+        temperature: float,
+        *extra: Any,
+        model: Optional[str] = None,
+    ) -> str | None:
+        """Build a content-addressed cache key, or None if the call is uncacheable."""
+        if temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        # Key on whitespace-normalized content so prompts that differ only in
+        # spacing/indentation (re-runs, edited templates) share an entry.
+        normalized = [
+            (m.get("role"), " ".join(str(m.get("content") or "").split()))
+            for m in messages
+        ]
+        payload = orjson.dumps(
+            [normalized, model or self.model, temperature, *extra],
+            default=str,
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+
     def chat(
         self,
         messages: list[dict],
         temperature: float = 0.7,
         max_tokens: Optional[int] = 3000,
+        model: Optional[str] = None,
     ) -> str:
         """Send a chat completion request and return the response text.
 
@@ -76,12 +272,22 @@ class AIClient:
             messages: List of message dicts with 'role' and 'content' keys.
             temperature: Sampling temperature (0-2).
             max_tokens: Maximum tokens in response.
+            model: Optional per-call model override for lightweight tasks.
 
         Returns:
             The assistant's response text.
         """
+        model = model or self.model
+        cache_key = self._cache_key(
+            messages, temperature, "chat", max_tokens, model=model
+        )
+        if cache_key is not None:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         kwargs = {
-            "model": self.model,
+            "model": model,
             "messages": messages,
             "temperature": temperature,
             "max_tokens": max_tokens,
@@ -90,7 +296,10 @@ class AIClient:
         response = self._create_completion_with_retry(**kwargs)
         if not response.choices:
             raise ValueError("Empty response from API — model returned no choices.")
-        return response.choices[0].message.content or ""
+        content = response.choices[0].message.content or ""
+        if cache_key is not None and content:
+            llm_cache.set(cache_key, content, expire=LLM_CACHE_TTL)
+        return content
 
     def chat_stream(
         self,
@@ -114,16 +323,45 @@ class AIClient:
             "temperature": temperature,
             "max_tokens": max_tokens,
             "stream": True,
+            # Final chunk carries token usage (with empty choices)
+            "stream_options": {"include_usage": True},
         }
 
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        usage = None
+        # The slot is held until the stream is exhausted or closed (the
+        # generator's finally), so long completions count against the cap too
+        _llm_slots.acquire()
         try:
             stream = self.client.chat.completions.create(**kwargs)
-            for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            try:
+                for chunk in stream:
+                    if getattr(chunk, "usage", None):
+                        usage = chunk.usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        if first_token_at is None:
+                            first_token_at = time.perf_counter()
+                            logger.info(
+                                f"[AI STREAM] TTFT {first_token_at - started:.2f}s ({self.model})"
+                            )
+                        yield chunk.choices[0].delta.content
+                usage_text = (
+                    f", {usage.prompt_tokens} prompt + {usage.completion_tokens} "
+                    "completion tokens"
+                    if usage
+                    else ""
+                )
+                logger.info(
+                    f"[AI STREAM] Completed in {time.perf_counter() - started:.2f}s{usage_text}"
+                )
+            finally:
+                stream.close()
         except RateLimitError as err:
             logger.warning(f"Rate limit hit during streaming: {err}")
             raise
+        finally:
+            _llm_slots.release()
 
     def chat_with_tools(
         self,
@@ -159,6 +397,106 @@ class AIClient:
             )
 
         messages = messages.copy()
+        content = self._run_tool_loop(
+            messages, tools, tool_executor, temperature, max_tool_calls, on_tool_call
+        )
+        if content is not None:
+            return content
+
+        # Tool budget used up: the model still has to read the last results,
+        # so ask for the final answer with tool_choice="none". Keeping the
+        # tool definitions lets providers that require them alongside tool
+        # messages accept the request instead of failing it.
+        response = self._create_completion_with_retry(
+            model=self.model,
+            messages=messages,
+            tools=tools,
+            tool_choice="none",
+            temperature=temperature,
+        )
+        if not response.choices:
+            raise ValueError("Empty response from API — model returned no choices.")
+        return response.choices[0].message.content or ""
+
+    def chat_with_tools_structured(
+        self,
+        messages: list[dict],
+        tools: list[dict],
+        tool_executor: Callable[[str, dict[str, Any]], str],
+        response_format: Type[T],
+        temperature: float = 0.7,
+        max_tool_calls: int = 2,
+        on_tool_call: Optional[Callable[[str, dict], None]] = None,
+    ) -> tuple[T, str]:
+        """Run tools, then answer directly with a structured response.
+
+        Unlike chat_with_tools followed by chat_structured, the tool results
+        go straight into the structured call, so there is no intermediate
+        prose answer and the prompt is only prefilled once more. Tool calls
+        and results are flattened into one system message first, since some
+        providers reject tool-role messages in a request without tools. An
+        answer the model gives on its own is used directly when it already
+        fits the schema, and as source material otherwise.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content' keys.
+            tools: List of tool definitions for OpenAI.
+            tool_executor: Function that executes tools and returns results.
+            response_format: Pydantic model class for the response.
+            temperature: Sampling temperature (0-2).
+            max_tool_calls: Maximum number of tool calls to allow.
+            on_tool_call: Optional callback when a tool is called (for UI updates).
+
+        Returns:
+            Tuple of (parsed response, tool results joined as research text).
+        """
+        if "gemini-3" in self.model.lower():
+            results = self._fallback_search(
+                messages, tool_executor, max_tool_calls, on_tool_call
+            )
+        else:
+            results = []
+            # The tool loop appends tool-role messages to the list it is
+            # given; those stay out of the structured request below
+            answer = self._run_tool_loop(
+                messages.copy(),
+                tools,
+                tool_executor,
+                temperature,
+                max_tool_calls,
+                on_tool_call,
+                results=results,
+            )
+            if answer:
+                try:
+                    parsed = response_format.model_validate_json(
+                        _strip_code_fence(answer)
+                    )
+                    return parsed, "\n\n".join(results)
+                except ValueError:
+                    # Prose answer: structure it rather than discard it
+                    results.append(answer)
+
+        messages = _with_research_results(messages, results)
+        parsed = self.chat_structured(messages, response_format, temperature=temperature)
+        return parsed, "\n\n".join(results)
+
+    def _run_tool_loop(
+        self,
+        messages: list[dict],
+        tools: list[dict],
+        tool_executor: Callable[[str, dict[str, Any]], str],
+        temperature: float,
+        max_tool_calls: int,
+        on_tool_call: Optional[Callable[[str, dict], None]],
+        results: Optional[list[str]] = None,
+    ) -> Optional[str]:
+        """Let the model call tools, appending calls and results to messages.
+
+        Returns the model's answer if it stopped calling tools on its own, or
+        None once max_tool_calls is reached. Tool results are also collected
+        into ``results`` when given.
+        """
         tool_calls_made = 0
 
         while tool_calls_made < max_tool_calls:
@@ -181,25 +519,25 @@ class AIClient:
             # Add the assistant message with tool calls
             messages.append(message.model_dump())
 
-            # Execute each tool call
+            # Parse every tool call first, then execute them concurrently
+            calls: list[tuple[str, dict[str, Any]]] = []
             for tool_call in message.tool_calls:
                 tool_name = tool_call.function.name
                 try:
-                    arguments = json.loads(tool_call.function.arguments)
-                except json.JSONDecodeError:
+                    arguments = orjson.loads(tool_call.function.arguments)
+                except orjson.JSONDecodeError:
                     arguments = {}
 
                 # Log the tool call
                 logger.info(f"[AI TOOL CALL] {tool_name}: {arguments}")
+                calls.append((tool_name, arguments))
 
-                # Notify UI if callback provided
-                if on_tool_call:
-                    on_tool_call(tool_name, arguments)
+            call_results = execute_tools_parallel(tool_executor, calls, on_tool_call)
+            if results is not None:
+                results.extend(call_results)
 
-                # Execute the tool
-                result = tool_executor(tool_name, arguments)
-
-                # Add tool result to messages
+            # Add tool results to messages
+            for tool_call, result in zip(message.tool_calls, call_results):
                 messages.append(
                     {
                         "role": "tool",
@@ -209,29 +547,16 @@ class AIClient:
                 )
                 tool_calls_made += 1
 
-        # If we hit max tool calls, get final response without tools
-        response = self._create_completion_with_retry(
-            model=self.model,
-            messages=messages,
-            temperature=temperature,
-        )
-        if not response.choices:
-            raise ValueError("Empty response from API — model returned no choices.")
-        return response.choices[0].message.content or ""
+        return None
 
-    def _chat_with_tools_fallback(
+    def _fallback_search(
         self,
         messages: list[dict],
         tool_executor: Callable[[str, dict[str, Any]], str],
-        temperature: float = 0.7,
-        max_tool_calls: int = 2,
-        on_tool_call: Optional[Callable[[str, dict], None]] = None,
-    ) -> str:
-        """Fallback path for models that do not support tool calls.
-
-        Asks the model for search queries, runs web_search directly, then
-        appends results and continues the chat without tools.
-        """
+        max_tool_calls: int,
+        on_tool_call: Optional[Callable[[str, dict], None]],
+    ) -> list[str]:
+        """Ask the extraction model for search queries and run them directly."""
         convo = "\n".join(
             f"{m.get('role', 'user')}: {m.get('content', '')}" for m in messages
         )
@@ -247,6 +572,7 @@ Conversation:
                 {"role": "user", "content": query_prompt},
             ],
             temperature=0.2,
+            model=EXTRACTION_MODEL,
         )
         raw_lines = [line.strip("•- \t") for line in query_text.splitlines()]
         queries = [line for line in raw_lines if line and line.upper() != "NONE"]
@@ -254,24 +580,34 @@ Conversation:
 
         logger.info(f"[AI FALLBACK] Generated {len(queries)} search queries: {queries}")
 
-        results: list[str] = []
         for query in queries:
             logger.info(f"[AI FALLBACK] Executing search: {query}")
-            if on_tool_call:
-                on_tool_call("web_search", {"query": query})
-            result = tool_executor("web_search", {"query": query})
-            results.append(result)
+        return execute_tools_parallel(
+            tool_executor,
+            [("web_search", {"query": query}) for query in queries],
+            on_tool_call,
+        )
 
-        messages = messages.copy()
-        if results:
-            messages.append(
-                {
-                    "role": "system",
-                    "content": "Research results:\n" + "\n\n".join(results),
-                }
-            )
+    def _chat_with_tools_fallback(
+        self,
+        messages: list[dict],
+        tool_executor: Callable[[str, dict[str, Any]], str],
+        temperature: float = 0.7,
+        max_tool_calls: int = 2,
+        on_tool_call: Optional[Callable[[str, dict], None]] = None,
+    ) -> str:
+        """Fallback path for models that do not support tool calls.
+
+        Asks the model for search queries, runs web_search directly, then
+        appends results and continues the chat without tools.
+        """
+        results = self._fallback_search(
+            messages, tool_executor, max_tool_calls, on_tool_call
+        )
 
-        return self.chat(messages, temperature=temperature)
+        return self.chat(
+            _with_research_results(messages, results), temperature=temperature
+        )
 
     def _build_example(self, schema: dict) -> dict:
         """Build a minimal example object from a JSON schema."""
@@ -324,6 +660,48 @@ Conversation:
             return self._build_example(prop)
         return "..."
 
+    def _schema_instruction(
+        self,
+        response_format: Type[BaseModel],
+        include_schema: bool,
+        include_example: bool,
+    ) -> str:
+        """Build the JSON instructions for a response model, once per class.
+
+        Schema generation and example building are deterministic for a given
+        Pydantic class, so the result is shared across all client instances.
+        """
+        key = (response_format, include_schema, include_example)
+        cached = AIClient._instruction_cache.get(key)
+        if cached is not None:
+            return cached
+
+        schema = response_format.model_json_schema()
+        example = self._build_example(schema) if include_example else None
+
+        example_block = (
+            "Expected structure:\n" + json.dumps(example, indent=2) + "\n\n"
+            if include_example
+            else ""
+        )
+        schema_block = (
+            "Full JSON schema for reference:\n" + json.dumps(schema, indent=2) + "\n\n"
+            if include_schema
+            else ""
+        )
+        instruction = (
+            "Respond with a JSON object using EXACTLY the structure below. "
+            "Fill in real values instead of placeholders.\n\n"
+            "CRITICAL: Every nested object MUST remain an object with its own keys. "
+            "Do NOT flatten objects into strings. For example, if the schema shows "
+            'an array of objects like [{"activity": "...", "cost_estimate": "..."}], '
+            "each element MUST be an object with those keys, NOT a plain string.\n\n"
+            f"{example_block}{schema_block}"
+            "Return ONLY the JSON object. No markdown, no explanation."
+        )
+        AIClient._instruction_cache[key] = instruction
+        return instruction
+
     def chat_structured(
         self,
         messages: list[dict],
@@ -332,6 +710,7 @@ Conversation:
         max_retries: int = 1,
         include_schema: bool = True,
         include_example: bool = True,
+        model: Optional[str] = None,
     ) -> T:
         """Send a chat request and parse response into a Pydantic model.
 
@@ -344,46 +723,42 @@ Conversation:
             response_format: Pydantic model class for the response.
             temperature: Sampling temperature (0-2).
             max_retries: Number of retries on validation failure.
+            model: Optional per-call model override, e.g. EXTRACTION_MODEL for
+                schema-filling tasks that don't need the main model.
 
         Returns:
             Parsed response as the specified Pydantic model.
         """
-        schema = response_format.model_json_schema()
-        example = self._build_example(schema) if include_example else None
-
-        example_block = (
-            "Expected structure:\n" + json.dumps(example, indent=2) + "\n\n"
-            if include_example
-            else ""
-        )
-        schema_block = (
-            "Full JSON schema for reference:\n" + json.dumps(schema, indent=2) + "\n\n"
-            if include_schema
-            else ""
+        model = model or self.model
+        cache_key = self._cache_key(
+            messages,
+            temperature,
+            response_format.__name__,
+            include_schema,
+            include_example,
+            model=model,
         )
-        schema_instruction = (
-            "Respond with a JSON object using EXACTLY the structure below. "
-            "Fill in real values instead of placeholders.\n\n"
-            "CRITICAL: Every nested object MUST remain an object with its own keys. "
-            "Do NOT flatten objects into strings. For example, if the schema shows "
-            'an array of objects like [{"activity": "...", "cost_estimate": "..."}], '
-            "each element MUST be an object with those keys, NOT a plain string.\n\n"
-            f"{example_block}{schema_block}"
-            "Return ONLY the JSON object. No markdown, no explanation."
+        if cache_key is not None:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return response_format.model_validate_json(cached)
+
+        schema_instruction = self._schema_instruction(
+            response_format, include_schema, include_example
         )
 
-        augmented_messages = messages.copy()
-        augmented_messages.append(
+        augmented_messages = [
+            *messages,
             {
                 "role": "user",
                 "content": schema_instruction,
-            }
-        )
+            },
+        ]
 
         last_error: Optional[Exception] = None
         for attempt in range(1 + max_retries):
             response = self._create_completion_with_retry(
-                model=self.model,
+                model=model,
                 messages=augmented_messages,
                 response_format={"type": "json_object"},
                 temperature=temperature,
@@ -395,12 +770,16 @@ Conversation:
                 )
                 raise ValueError(f"Empty response from API: {error_detail}")
 
-            content = response.choices[0].message.content or ""
+            content = _strip_code_fence(response.choices[0].message.content or "")
 
             try:
-                data = json.loads(content)
-                return response_format.model_validate(data)
-            except (json.JSONDecodeError, Exception) as e:
+                result = response_format.model_validate_json(content)
+                if cache_key is not None:
+                    llm_cache.set(
+                        cache_key, result.model_dump_json(), expire=LLM_CACHE_TTL
+                    )
+                return result
+            except Exception as e:
                 last_error = e
                 if attempt < max_retries:
                     # Feed the error back to the model for a retry
@@ -1,7 +1,17 @@
 """Formatting utilities for travel agent output."""
 
+import threading
+from collections import OrderedDict
+
 from app.agent.models import BudgetBreakdown, ConversationState, RiskAssessment, TravelPlan
 
+# Rendered plan text keyed by plan identity. Plans are replaced, never mutated,
+# so the text shown after planning is reused when refinement re-renders the
+# same plan into its prompt. Entries hold the plan itself so ids stay valid.
+PLAN_TEXT_CACHE_SIZE = 32
+_plan_text_cache: OrderedDict[int, tuple[TravelPlan, str]] = OrderedDict()
+_plan_text_lock = threading.Lock()
+
 
 def format_constraints(state: ConversationState) -> str:
     """Format constraints for prompts.
@@ -30,6 +40,22 @@ def format_constraints(state: ConversationState) -> str:
     return "\n".join(lines)
 
 
+def format_confirmed_assumptions(state: ConversationState) -> str:
+    """Format confirmed assumptions as a prompt section.
+
+    Args:
+        state: Current conversation state.
+
+    Returns:
+        Section text with a leading blank line, or "" if there are none.
+    """
+    if not state.assumptions:
+        return ""
+    return "\n\nConfirmed Assumptions:\n" + "".join(
+        f"• {a}\n" for a in state.assumptions.assumptions
+    )
+
+
 def format_risk_assessment(risk: RiskAssessment) -> str:
     """Format risk assessment as a friendly, conversational summary.
 
@@ -63,6 +89,22 @@ def format_plan(plan: TravelPlan) -> str:
     Returns:
         Formatted plan string.
     """
+    with _plan_text_lock:
+        cached = _plan_text_cache.get(id(plan))
+        if cached is not None and cached[0] is plan:
+            _plan_text_cache.move_to_end(id(plan))
+            return cached[1]
+
+    text = _render_plan(plan)
+
+    with _plan_text_lock:
+        _plan_text_cache[id(plan)] = (plan, text)
+        if len(_plan_text_cache) > PLAN_TEXT_CACHE_SIZE:
+            _plan_text_cache.popitem(last=False)
+    return text
+
+
+def _render_plan(plan: TravelPlan) -> str:
     lines = [f"**{plan.summary}**"]
     lines.append(f"• Route: {plan.route}")
 
@@ -76,12 +118,12 @@ def format_plan(plan: TravelPlan) -> str:
     for day in plan.days:
         lines.append(f"**Day {day.day}: {day.title}**")
 
-        for activity in day.activities:
-            cost_str = (
-                f" — {activity.cost_estimate}" if activity.cost_estimate else ""
-            )
-            notes_str = f"  ({activity.cost_notes})" if activity.cost_notes else ""
-            lines.append(f"• {activity.activity}{cost_str}{notes_str}")
+        lines.extend(
+            f"• {a.activity}"
+            f"{f' — {a.cost_estimate}' if a.cost_estimate else ''}"
+            f"{f'  ({a.cost_notes})' if a.cost_notes else ''}"
+            for a in day.activities
+        )
 
         if day.travel_time:
             travel_cost = f" ({day.travel_cost})" if day.travel_cost else ""
@@ -107,23 +149,26 @@ def format_plan(plan: TravelPlan) -> str:
         # Display tips for this day
         if day.tips:
             lines.append("• Tips:")
-            for tip in day.tips:
-                lines.append(f"  → {tip}")
+            lines.extend(f"  → {tip}" for tip in day.tips)
 
         lines.append("")
 
     # Budget breakdown
     if plan.budget_breakdown:
         b = plan.budget_breakdown
-        lines.append("---\n")
-        lines.append("**Budget Breakdown**\n")
-        lines.append(f"• Flights: {b.flights}")
-        lines.append(f"• Accommodation: {b.accommodation}")
-        lines.append(f"• Transport: {b.local_transport}")
-        lines.append(f"• Meals: {b.meals}")
-        lines.append(f"• Activities: {b.activities}")
-        lines.append(f"• Misc: {b.miscellaneous}")
-        lines.append(f"• **Total: {b.total}**")
+        lines.extend(
+            [
+                "---\n",
+                "**Budget Breakdown**\n",
+                f"• Flights: {b.flights}",
+                f"• Accommodation: {b.accommodation}",
+                f"• Transport: {b.local_transport}",
+                f"• Meals: {b.meals}",
+                f"• Activities: {b.activities}",
+                f"• Misc: {b.miscellaneous}",
+                f"• **Total: {b.total}**",
+            ]
+        )
         if b.notes:
             lines.append(f"\n{b.notes}")
 
@@ -131,7 +176,6 @@ def format_plan(plan: TravelPlan) -> str:
     if plan.general_tips:
         lines.append("\n---\n")
         lines.append("**Tips & Good to Know**\n")
-        for tip in plan.general_tips:
-            lines.append(f"• {tip}")
+        lines.extend(f"• {tip}" for tip in plan.general_tips)
 
     return "\n".join(lines)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import MutableSequence
 from typing import Any, Callable, Optional, TypedDict
 
 from langgraph.graph import END, StateGraph
@@ -16,7 +17,8 @@ from app.agent.phases import (
     planning,
     refinement,
 )
-from app.agent.sanitizer import sanitize_input
+from app.agent.sanitizer import log_injection, sanitize_input
+from app.agent.utils import RESEARCH_TOKEN_BUDGET, trim_to_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -25,12 +27,13 @@ class AgentGraphState(TypedDict):
     action: str
     input: dict[str, Any]
     agent_state: ConversationState
-    search_results: list[str]
-    user_interests: list[str]
+    search_results: MutableSequence[str]
+    user_interests: MutableSequence[str]
     initial_extraction: Optional[InitialExtraction]
     response: str
     has_high_risk: bool
     language_code: Optional[str]
+    speculative_assumptions: Optional[assumptions.SpeculativeAssumptions]
 
 
 def build_agent_graph(
@@ -66,15 +69,27 @@ def build_agent_graph(
         state["agent_state"].constraints = constraints
         state["agent_state"].phase = Phase.FEASIBILITY
 
+        # Assumptions only need the constraints and the feasibility verdict,
+        # so generate them alongside the check, betting on "feasible".
+        speculation = assumptions.start_speculative_assumptions(
+            fast_client, state["agent_state"], lang_code
+        )
+
         response, has_high_risk = feasibility.run_feasibility_check(
             fast_client,
             state["agent_state"],
             state["search_results"],
             on_tool_call,
             lang_code,
+            prefetched_research=state["input"].get("prefetched_research", ""),
+            prefetched_period=state["input"].get("prefetched_period"),
         )
         state["response"] = response
         state["has_high_risk"] = has_high_risk
+        if has_high_risk:
+            speculation[1].cancel()
+            speculation = None
+        state["speculative_assumptions"] = speculation
         return state
 
     def node_proceed(state: AgentGraphState) -> AgentGraphState:
@@ -82,6 +97,8 @@ def build_agent_graph(
         agent_state = state["agent_state"]
         awaiting = agent_state.awaiting_confirmation
         agent_state.awaiting_confirmation = False
+        speculation = state.get("speculative_assumptions")
+        state["speculative_assumptions"] = None
 
         if awaiting and not proceed:
             state["response"] = (
@@ -99,7 +116,7 @@ def build_agent_graph(
         agent_state.phase = Phase.ASSUMPTIONS
         lang_code = state.get("language_code")
         state["response"] = assumptions.generate_assumptions(
-            fast_client, agent_state, lang_code
+            fast_client, agent_state, lang_code, speculation=speculation
         )
         state["has_high_risk"] = False
         return state
@@ -111,6 +128,7 @@ def build_agent_graph(
         agent_state = state["agent_state"]
         lang_code = state.get("language_code")
         agent_state.awaiting_confirmation = False
+        research_future = None
 
         user_modifications = modifications
         if additional_interests:
@@ -119,10 +137,7 @@ def build_agent_graph(
         if not confirmed and user_modifications:
             result = sanitize_input(user_modifications)
             user_modifications = result.text
-            if result.injection_detected:
-                logger.warning(
-                    "Possible prompt injection in modifications: %s", result.flags
-                )
+            log_injection(result, "modifications")
 
             state["user_interests"].append(user_modifications)
             if agent_state.constraints:
@@ -131,10 +146,24 @@ def build_agent_graph(
             agent_state.add_message("user", f"Adjustments needed: {user_modifications}")
 
             search_results = assumptions.search_for_interests(
-                fast_client, agent_state, user_modifications, on_tool_call, lang_code
+                fast_client, agent_state, user_modifications, on_tool_call
             )
             if search_results:
-                state["search_results"].append(search_results)
+                state["search_results"].append(
+                    trim_to_tokens(search_results, RESEARCH_TOKEN_BUDGET)
+                )
+
+            # Planning research builds on the interest search, but not on the
+            # assumptions update; run it alongside the update. Its prompt is
+            # snapshotted before the update touches the state.
+            research_future = planning.start_planning_research(
+                client,
+                agent_state,
+                state["search_results"],
+                state["user_interests"],
+                on_tool_call,
+                lang_code,
+            )
 
             assumptions.update_assumptions_with_interests(
                 fast_client,
@@ -152,6 +181,8 @@ def build_agent_graph(
             state["user_interests"],
             on_tool_call,
             lang_code,
+            research_future=research_future,
+            get_flight_costs=state["input"].get("get_flight_costs"),
         )
         state["has_high_risk"] = False
         return state
@@ -7,6 +7,7 @@ from uuid import UUID
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.agent import prompts
 from app.db.models import UserPreference
 
 logger = logging.getLogger(__name__)
@@ -95,27 +96,4 @@ def get_language_instruction(language_code: Optional[str]) -> str:
     if not language_code:
         return ""
 
-    language_names = {
-        "en": "English",
-        "fr": "French",
-        "es": "Spanish",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "nl": "Dutch",
-        "ru": "Russian",
-        "zh": "Chinese",
-        "ja": "Japanese",
-        "ko": "Korean",
-        "ar": "Arabic",
-        "hi": "Hindi",
-        "tr": "Turkish",
-        "pl": "Polish",
-        "sv": "Swedish",
-        "no": "Norwegian",
-        "da": "Danish",
-        "fi": "Finnish",
-    }
-
-    lang_name = language_names.get(language_code, language_code)
-    return f"\n\nLANGUAGE PREFERENCE: The user prefers to communicate in {lang_name} ({language_code}). ALL your responses MUST be in {lang_name}."
+    return prompts.get_language_instruction(language_code)
@@ -1,5 +1,6 @@
-"""Pydantic models for conversation state and LLM responses."""
+"""Data models for conversation state and LLM responses."""
 
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
@@ -90,6 +91,18 @@ class InitialExtraction(BaseModel):
     )
 
 
+class InitialExtractionWithClarification(InitialExtraction):
+    """Initial extraction plus the clarification message, in one response."""
+
+    clarification_message: str = Field(
+        default="",
+        description=(
+            "Friendly message asking ONLY for the trip details that are still "
+            "missing, written in the user's language"
+        ),
+    )
+
+
 class TravelConstraints(BaseModel):
     """User's travel constraints extracted from clarification answers."""
 
@@ -274,47 +287,71 @@ class RefinementOptions(BaseModel):
     )
 
 
-class Message(BaseModel):
-    """A single message in the conversation."""
+@dataclass(slots=True)
+class Message:
+    """A single message in the conversation (system, user, or assistant)."""
 
-    role: str = Field(description="Message role: system, user, or assistant")
-    content: str = Field(description="Message content")
+    role: str
+    content: str
 
 
-class ConversationState(BaseModel):
-    """Complete state of the travel planning conversation."""
+# Number of recent user/assistant turns sent back to the model
+HISTORY_WINDOW = 8
 
-    phase: Phase = Field(
-        default=Phase.CLARIFICATION, description="Current conversation phase"
-    )
-    origin: Optional[str] = Field(default=None, description="Starting location")
-    destination: Optional[str] = Field(default=None, description="Travel destination")
-    constraints: Optional[TravelConstraints] = Field(
-        default=None, description="User's travel constraints"
-    )
-    risk_assessment: Optional[RiskAssessment] = Field(
-        default=None, description="Risk assessment results"
-    )
-    assumptions: Optional[Assumptions] = Field(
-        default=None, description="Assumptions for planning"
-    )
-    current_plan: Optional[TravelPlan] = Field(
-        default=None, description="Generated travel plan"
-    )
-    messages: list[Message] = Field(
-        default_factory=list, description="Full conversation history"
-    )
-    awaiting_confirmation: bool = Field(
-        default=False, description="Waiting for user confirmation"
-    )
-    vibe: Optional[str] = Field(
-        default=None, description="The requested vibe/aesthetic for the trip"
+
+@dataclass(slots=True)
+class ConversationState:
+    """Complete state of the travel planning conversation.
+
+    Internal mutable state, never validated or serialized as a whole, so a
+    slotted dataclass is used instead of a Pydantic model.
+    """
+
+    phase: Phase = Phase.CLARIFICATION
+    origin: Optional[str] = None
+    destination: Optional[str] = None
+    constraints: Optional[TravelConstraints] = None
+    risk_assessment: Optional[RiskAssessment] = None
+    assumptions: Optional[Assumptions] = None
+    current_plan: Optional[TravelPlan] = None
+    messages: list[Message] = field(default_factory=list)  # Full history
+    awaiting_confirmation: bool = False
+    vibe: Optional[str] = None  # Requested vibe/aesthetic for the trip
+    # Bumped on every add_message; keys the serialized-messages cache below
+    _version: int = field(default=0, repr=False)
+    _openai_cache: Optional[tuple[int, Optional[int], list[dict]]] = field(
+        default=None, repr=False
     )
 
     def add_message(self, role: str, content: str) -> None:
         """Add a message to the conversation history."""
         self.messages.append(Message(role=role, content=content))
-
-    def get_openai_messages(self) -> list[dict]:
-        """Get messages in OpenAI API format."""
-        return [{"role": m.role, "content": m.content} for m in self.messages]
+        self._version += 1
+
+    def get_openai_messages(self, window: Optional[int] = HISTORY_WINDOW) -> list[dict]:
+        """Get messages in OpenAI API format.
+
+        The system messages and the first user turn (the trip request with
+        the known details) form a fixed prefix that stays byte-identical
+        across calls, so the provider can prefix-cache it. Of the remaining
+        turns only the last ``window`` are sent. Pass ``window=None`` for the
+        full history.
+
+        The serialized list is cached until the next ``add_message``.
+        """
+        cached = self._openai_cache
+        if cached is not None and cached[:2] == (self._version, window):
+            return list(cached[2])
+
+        messages = self.messages
+        if window is not None:
+            prefix = [m for m in messages if m.role == "system"]
+            turns = [m for m in messages if m.role != "system"]
+            if turns and turns[0].role == "user":
+                prefix.append(turns[0])
+                turns = turns[1:]
+            if len(turns) > window:
+                messages = prefix + turns[-window:]
+        serialized = [{"role": m.role, "content": m.content} for m in messages]
+        self._openai_cache = (self._version, window, serialized)
+        return list(serialized)
@@ -2,14 +2,22 @@
 
 import logging
 import concurrent.futures
-from datetime import datetime
+from collections.abc import MutableSequence
 from typing import TYPE_CHECKING, Callable, Iterator, Tuple
 
+import orjson
+
+from app.agent.ai_client import EXTRACTION_MODEL, execute_tools_parallel
 from app.agent.formatters import format_constraints, format_risk_assessment
-from app.agent.models import ConversationState, Phase, RiskAssessment
+from app.agent.models import ConversationState, Phase, RiskAssessment, RiskLevel
 from app.agent.prompts import get_phase_prompt
-from app.agent.tools import TOOL_DEFINITIONS, execute_tool
-from app.agent.utils import get_current_date_context
+from app.agent.tools import TOOL_DEFINITIONS, execute_tool, format_search_results
+from app.agent.utils import (
+    RESEARCH_TOKEN_BUDGET,
+    get_current_year,
+    get_search_date_context,
+    trim_to_tokens,
+)
 
 if TYPE_CHECKING:
     from app.agent.ai_client import AIClient
@@ -19,6 +27,38 @@ logger = logging.getLogger(__name__)
 # Background thread pool for fire-and-forget JSON structuring
 _bg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
 
+# Prompt templates, filled with str.format per call
+RESEARCH_PROMPT_TEMPLATE = """You need to evaluate the feasibility of this trip:
+
+{date_context}
+
+{constraints_text}
+
+Before providing your assessment, search for current information about:
+1. Current travel advisories or restrictions for the destination
+2. Weather/seasonal conditions for the specified travel period
+3. Any recent infrastructure or accessibility issues
+
+Use the web_search tool to gather this information, then provide your risk assessment."""
+
+ASSESSMENT_PROMPT_TEMPLATE = """Based on the information gathered, provide a structured risk assessment for this trip:
+
+{constraints_text}
+
+Research findings:
+{search_response}
+
+Provide a risk assessment for each category."""
+
+ASSESSMENT_STREAM_PROMPT_TEMPLATE = """Based on the information gathered, provide a detailed feasibility assessment and risk analysis for this trip:
+
+{constraints_text}
+
+Research findings:
+{search_response}
+
+Be specific about weather, route, health, and infrastructure. Include a clear conclusion on whether it's safe and recommended."""
+
 
 def _parse_risk_bg(
     client: "AIClient",
@@ -36,6 +76,7 @@ def _parse_risk_bg(
             ],
             RiskAssessment,
             temperature=0.1,
+            model=EXTRACTION_MODEL,
         )
         state.risk_assessment = risk
         logger.info("Background risk assessment structuring completed")
@@ -54,6 +95,99 @@ def _quick_high_risk_check(text: str) -> bool:
     return any(indicator in lowered for indicator in high_indicators)
 
 
+def _prefetch_topics(destination: str, period: str | None) -> list[tuple[str, str]]:
+    """(label, query) pairs for the destination-level feasibility searches."""
+    year = get_current_year()
+    when = f"{period} {year}" if period else str(year)
+    return [
+        ("Travel advisories", f"{destination} travel advisory {year}"),
+        ("Weather/season", f"{destination} weather {when}"),
+        ("Infrastructure", f"{destination} transport disruptions {year}"),
+    ]
+
+
+def _is_error_result(result: str) -> bool:
+    """Whether a web_search tool result carries no actual search results."""
+    try:
+        data = orjson.loads(result)
+    except orjson.JSONDecodeError:
+        return False
+    if isinstance(data, dict):
+        return "error" in data
+    if isinstance(data, list):
+        return all(isinstance(item, dict) and "error" in item for item in data)
+    return False
+
+
+def _format_prefetch_result(result: str) -> str:
+    """Render one web_search tool result (JSON) as readable text."""
+    try:
+        data = orjson.loads(result)
+    except orjson.JSONDecodeError:
+        return result
+    if isinstance(data, dict):
+        data = [data]
+    return format_search_results(data)
+
+
+def prefetch_destination_research(destination: str, period: str | None = None) -> str:
+    """Run the destination-level feasibility searches ahead of time.
+
+    Advisories, seasonal weather and infrastructure news depend only on the
+    destination and travel period, so they can run while the user is still
+    answering the clarification questions.
+
+    Returns:
+        The combined results, or "" if every search failed, so callers fall
+        back to the full research.
+    """
+    topics = _prefetch_topics(destination, period)
+    results = execute_tools_parallel(
+        execute_tool, [("web_search", {"query": query}) for _, query in topics]
+    )
+    if all(_is_error_result(result) for result in results):
+        logger.warning(f"All prefetched research searches failed for {destination!r}")
+        return ""
+    # Each topic gets its own share of the research budget (less room for its
+    # header line), so a long first topic can't push the later ones out when
+    # the whole text is trimmed
+    topic_budget = RESEARCH_TOKEN_BUDGET // len(topics) - 25
+    return "\n\n".join(
+        f"{label} ({query}):\n"
+        + trim_to_tokens(_format_prefetch_result(result), topic_budget)
+        for (label, query), result in zip(topics, results)
+    )
+
+
+def _current_research(
+    state: ConversationState,
+    prefetched_research: str,
+    prefetched_period: str | None,
+    on_tool_call: Callable[[str, dict], None] | None = None,
+) -> str:
+    """Return prefetched research if it still matches the travel period.
+
+    The prefetch runs before clarification, so the period may have been
+    added or changed since. The destination is fixed at start; when only
+    the period differs, re-run the (search-only) prefetch for the new one,
+    which is still far cheaper than the LLM-driven research. The searches
+    behind the returned research are reported through ``on_tool_call``.
+    """
+    if not prefetched_research:
+        return ""
+    destination = state.destination or ""
+    period = state.constraints.month_or_season if state.constraints else None
+    if not period or period.strip().lower() == (prefetched_period or "").strip().lower():
+        research, period = prefetched_research, prefetched_period
+    else:
+        logger.info(f"Travel period changed to {period!r}; refreshing prefetched research")
+        research = prefetch_destination_research(destination, period)
+    if research and on_tool_call:
+        for _, query in _prefetch_topics(destination, period):
+            on_tool_call("web_search", {"query": query})
+    return research
+
+
 def _gather_research(
     client: "AIClient",
     state: ConversationState,
@@ -63,22 +197,11 @@ def _gather_research(
     """Helper to gather current research info via web search."""
     system_prompt = get_phase_prompt("feasibility", language_code)
     constraints_text = format_constraints(state)
-    date_context = get_current_date_context()
-
-    search_prompt = f"""You need to evaluate the feasibility of this trip:
+    date_context = get_search_date_context()
 
-{date_context}
-
-{constraints_text}
-
-Before providing your assessment, search for current information about:
-1. Current travel advisories or restrictions for the destination
-2. Weather/seasonal conditions for the specified travel period
-3. Any recent infrastructure or accessibility issues
-
-IMPORTANT: Use the CURRENT YEAR ({datetime.now().year}) in your search queries, not past years.
-
-Use the web_search tool to gather this information, then provide your risk assessment."""
+    search_prompt = RESEARCH_PROMPT_TEMPLATE.format(
+        date_context=date_context, constraints_text=constraints_text
+    )
 
     messages = [
         {"role": "system", "content": system_prompt},
@@ -98,33 +221,38 @@ Use the web_search tool to gather this information, then provide your risk asses
 def run_feasibility_check(
     client: "AIClient",
     state: ConversationState,
-    search_results: list[str],
+    search_results: MutableSequence[str],
     on_tool_call: Callable[[str, dict], None] | None = None,
     language_code: str | None = None,
+    prefetched_research: str = "",
+    prefetched_period: str | None = None,
 ) -> tuple[str, bool]:
     """Run feasibility check and return risk assessment."""
-    search_response = _gather_research(
-        client, state, on_tool_call=on_tool_call, language_code=language_code
+    search_response = trim_to_tokens(
+        _current_research(
+            state, prefetched_research, prefetched_period, on_tool_call
+        )
+        or _gather_research(
+            client, state, on_tool_call=on_tool_call, language_code=language_code
+        ),
+        RESEARCH_TOKEN_BUDGET,
     )
     search_results.append(search_response)
 
     system_prompt = get_phase_prompt("feasibility", language_code)
     constraints_text = format_constraints(state)
 
-    assessment_prompt = f"""Based on the information gathered, provide a structured risk assessment for this trip:
-
-{constraints_text}
-
-Research findings:
-{search_response}
-
-Provide a risk assessment for each category."""
+    assessment_prompt = ASSESSMENT_PROMPT_TEMPLATE.format(
+        constraints_text=constraints_text, search_response=search_response
+    )
 
     assessment_messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": assessment_prompt},
     ]
 
+    # The assessment decides has_high_risk, so it stays on the client's model;
+    # the extraction model only re-parses text (see _parse_risk_bg)
     risk = client.chat_structured(assessment_messages, RiskAssessment, temperature=0.3)
     state.risk_assessment = risk
 
@@ -144,37 +272,41 @@ Provide a risk assessment for each category."""
 def run_feasibility_check_stream(
     client: "AIClient",
     state: ConversationState,
-    search_results: list[str],
+    search_results: MutableSequence[str],
     on_tool_call: Callable[[str, dict], None] | None = None,
     language_code: str | None = None,
+    prefetched_research: str = "",
+    prefetched_period: str | None = None,
 ) -> Iterator[str]:
     """Run feasibility check with token streaming."""
-    search_response = _gather_research(
-        client, state, on_tool_call=on_tool_call, language_code=language_code
+    search_response = trim_to_tokens(
+        _current_research(
+            state, prefetched_research, prefetched_period, on_tool_call
+        )
+        or _gather_research(
+            client, state, on_tool_call=on_tool_call, language_code=language_code
+        ),
+        RESEARCH_TOKEN_BUDGET,
     )
     search_results.append(search_response)
 
     system_prompt = get_phase_prompt("feasibility", language_code)
     constraints_text = format_constraints(state)
 
-    assessment_prompt = f"""Based on the information gathered, provide a detailed feasibility assessment and risk analysis for this trip:
-
-{constraints_text}
-
-Research findings:
-{search_response}
-
-Be specific about weather, route, health, and infrastructure. Include a clear conclusion on whether it's safe and recommended."""
+    assessment_prompt = ASSESSMENT_STREAM_PROMPT_TEMPLATE.format(
+        constraints_text=constraints_text, search_response=search_response
+    )
 
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": assessment_prompt},
     ]
 
-    full_response = ""
+    chunks: list[str] = []
     for token in client.chat_stream(messages, temperature=0.3):
-        full_response += token
+        chunks.append(token)
         yield token
+    full_response = "".join(chunks)
 
     # Fire-and-forget: parse risk assessment in background
     _bg_executor.submit(_parse_risk_bg, client, system_prompt, full_response, state)
@@ -195,11 +327,9 @@ Be specific about weather, route, health, and infrastructure. Include a clear co
 
 def _check_high_risk(risk: RiskAssessment) -> bool:
     """Helper to check if any risk category is HIGH."""
-    return any(
-        [
-            risk.season_weather.value == "HIGH",
-            risk.route_accessibility.value == "HIGH",
-            risk.altitude_health.value == "HIGH",
-            risk.infrastructure.value == "HIGH",
-        ]
+    return RiskLevel.HIGH in (
+        risk.season_weather,
+        risk.route_accessibility,
+        risk.altitude_health,
+        risk.infrastructure,
     )
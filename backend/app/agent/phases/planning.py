@@ -2,14 +2,24 @@
 
 import logging
 import concurrent.futures
-from datetime import datetime
+from collections.abc import MutableSequence
 from typing import TYPE_CHECKING, Callable, Iterator
 
-from app.agent.formatters import format_constraints, format_plan
+from app.agent.formatters import (
+    format_confirmed_assumptions,
+    format_constraints,
+    format_plan,
+)
 from app.agent.models import ConversationState, Phase, TravelPlan
 from app.agent.prompts import get_phase_prompt
 from app.agent.tools import TOOL_DEFINITIONS, execute_tool
-from app.agent.utils import detect_budget_currency, get_current_date_context
+from app.agent.utils import (
+    RESEARCH_TOKEN_BUDGET,
+    detect_budget_currency,
+    get_search_date_context,
+    mentions_currency,
+    trim_to_tokens,
+)
 
 if TYPE_CHECKING:
     from app.agent.ai_client import AIClient
@@ -17,7 +27,108 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Background thread pool for fire-and-forget JSON structuring
-_bg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+_bg_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+# Planning research the caller waits on; kept apart so it never queues
+# behind background parsing
+_research_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="plan-research"
+)
+
+# Follow-up shown after every generated plan
+REFINEMENT_MENU = (
+    "\n\n---\nWant me to tweak anything? I can make it safer, faster, more "
+    "comfortable, or change the base location. Or if you're happy with it, "
+    "we're done!"
+)
+
+# Prompt templates, filled with str.format per call
+PLANNING_RESEARCH_PROMPT_TEMPLATE = """Generate a day-by-day itinerary for this trip:
+
+{date_context}
+
+{constraints_text}{assumptions_text}{interests_text}{search_context}
+
+PREVIOUS RESEARCH is provided above. Do NOT re-search for information already available there.
+
+Only search for information NOT already covered. Typical gaps:
+- Specific attraction entry fees
+- Average meal costs
+- Flight/Transport costs from origin to destination (if origin is known)
+- Offbeat spots matching interests
+
+IMPORTANT: ALL prices must be in {budget_currency}.
+
+{final_instruction}"""
+
+RESEARCH_ONLY_INSTRUCTION = (
+    "Use web_search to find current prices for gaps only, then return the findings."
+)
+RESEARCH_AND_PLAN_INSTRUCTION = (
+    "Use web_search to find current prices for gaps only, then build the "
+    "itinerary using the findings for accurate cost estimates."
+)
+
+PLAN_STRUCTURE_PROMPT_TEMPLATE = """Create a structured day-by-day itinerary based on this information:
+
+{constraints_text}{assumptions_text}{interests_text}
+
+Research findings (use these for accurate cost estimates):
+{planning_research}
+
+{flight_costs}
+
+CURRENCY: ALL prices MUST be in {budget_currency}."""
+
+PLAN_STREAM_PROMPT_TEMPLATE = """Create a detailed day-by-day itinerary based on this information:
+
+{constraints_text}{assumptions_text}{interests_text}
+
+Research findings (use these for accurate cost estimates):
+{research_context}
+
+{flight_costs}
+
+CURRENCY: ALL prices MUST be in {budget_currency}.
+
+FORMAT RULES (follow this EXACTLY):
+
+1. Start with an H1 title like "# 5-Day Itinerary for [Destination] Adventure"
+
+2. For each day use this format:
+## Day X: [Title]
+**Morning:** Activity description. Estimated cost: {budget_currency}X.
+**Noon/Afternoon/Evening:** Continue with specific activities.
+- Use **bold** for specific venue/restaurant names
+- Include estimated cost for EACH activity
+- Include specific timings where possible (e.g., "9:00 AM – 11:00 AM")
+
+**Tips:**
+- 2-4 practical tips per day (money-saving hacks, must-try food, hidden gems, important warnings)
+
+**Day X total:** Accommodation {budget_currency}X + Food {budget_currency}X + Activities {budget_currency}X + Transport {budget_currency}X = {budget_currency}X
+
+3. After all days, include:
+## Budget Breakdown
+- List each day's total
+- Show Total Spending
+- Show Budget Left (if under budget)
+
+## General Tips for Your Trip
+- Visa/entry requirements
+- SIM card / connectivity advice
+- Cultural etiquette
+- Essential apps to download
+- Money exchange tips
+- Packing essentials for the season
+
+QUALITY RULES:
+- Recommend SPECIFIC named hotels with neighborhood and per-night cost
+- Recommend SPECIFIC named restaurants for meals (not generic "lunch at a café")
+- Include realistic transport between locations with mode and cost
+- Every activity must have a cost estimate
+- Be concise but specific — 1-2 lines per activity, not paragraphs
+- Do NOT list generic "Breakfast", "Lunch", "Dinner" unless it's a famous food spot
+- Focus on specific places, things to do, and unique experiences"""
 
 
 def _parse_plan_bg(
@@ -45,64 +156,116 @@ def _parse_plan_bg(
         logger.exception("Background plan structuring failed")
 
 
-def _gather_planning_research(
-    client: "AIClient",
+def _needs_research(
     state: ConversationState,
-    search_results: list[str],
-    user_interests: list[str],
-    on_tool_call: Callable[[str, dict], None] | None = None,
-    language_code: str | None = None,
-) -> str:
-    """Helper to gather planning-specific info via web search."""
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
+) -> bool:
+    """Whether planning should run its own web research round-trip.
+
+    Skipped only when the latest stored research is substantial and mentions
+    one of the user's interests, and recent research already quotes prices in
+    the budget currency; the research prompt would mostly tell the model not
+    to re-search it anyway. With no stated interests there is nothing to
+    check coverage against, so research always runs.
+    """
+    if not search_results:
+        return True
+    latest = search_results[-1]
+    if len(latest) <= 500:
+        return True
+    words = {
+        word
+        for interest in user_interests
+        for word in interest.lower().split()
+        if len(word) > 3
+    }
+    if not words:
+        return True
+    latest = latest.lower()
+    if not any(word in latest for word in words):
+        return True
+    currency = detect_budget_currency(state)
+    return not any(
+        mentions_currency(r, currency) for r in list(search_results)[-3:]
+    )
+
+
+def _research_messages(
+    state: ConversationState,
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
+    language_code: str | None,
+    final_instruction: str,
+    flight_costs: str = "",
+) -> list[dict]:
+    """Build the planning research prompt, ending with ``final_instruction``.
+
+    Known ``flight_costs`` are added to the previous findings, so the model
+    doesn't search for them again.
+    """
     vibe = state.vibe or (state.constraints.vibe if state.constraints else None)
     system_prompt = get_phase_prompt("planning", language_code, vibe=vibe)
     constraints_text = format_constraints(state)
-    assumptions_text = ""
-    if state.assumptions:
-        assumptions_text = "\n\nConfirmed Assumptions:\n"
-        for a in state.assumptions.assumptions:
-            assumptions_text += f"• {a}\n"
+    assumptions_text = format_confirmed_assumptions(state)
 
     search_context = ""
     if search_results:
         search_context = "\n\nPrevious research findings:\n" + "\n".join(
-            search_results[-3:]
+            trim_to_tokens(r, RESEARCH_TOKEN_BUDGET) for r in list(search_results)[-3:]
         )
+    if flight_costs:
+        search_context += f"\n\n{flight_costs}"
 
     interests_text = ""
     if user_interests:
-        interests_text = "\n\nUser's specific interests to incorporate:\n"
-        for interest in user_interests:
-            interests_text += f"• {interest}\n"
+        interests_text = "\n\nUser's specific interests to incorporate:\n" + "".join(
+            f"• {interest}\n" for interest in user_interests
+        )
 
-    date_context = get_current_date_context()
+    date_context = get_search_date_context()
     budget_currency = detect_budget_currency(state)
 
-    research_prompt = f"""Generate a day-by-day itinerary for this trip:
-
-{date_context}
-
-{constraints_text}{assumptions_text}{interests_text}{search_context}
-
-PREVIOUS RESEARCH is provided above. Do NOT re-search for information already available there.
-
-Only search for information NOT already covered. Typical gaps:
-- Specific attraction entry fees
-- Average meal costs
-- Flight/Transport costs from origin to destination (if origin is known)
-- Offbeat spots matching interests
-
-IMPORTANT:
-- Use the CURRENT YEAR ({datetime.now().year}) in all search queries.
-- ALL prices must be in {budget_currency}.
-
-Use web_search to find current prices for gaps only, then return the findings."""
+    research_prompt = PLANNING_RESEARCH_PROMPT_TEMPLATE.format(
+        date_context=date_context,
+        constraints_text=constraints_text,
+        assumptions_text=assumptions_text,
+        interests_text=interests_text,
+        search_context=search_context,
+        budget_currency=budget_currency,
+        final_instruction=final_instruction,
+    )
 
-    messages = [
+    return [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": research_prompt},
     ]
 
+
+def _gather_planning_research(
+    client: "AIClient",
+    state: ConversationState,
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
+    on_tool_call: Callable[[str, dict], None] | None = None,
+    language_code: str | None = None,
+) -> str:
+    """Helper to gather planning-specific info via web search."""
+    messages = _research_messages(
+        state,
+        search_results,
+        user_interests,
+        language_code,
+        RESEARCH_ONLY_INSTRUCTION,
+    )
+    return _run_research(client, messages, on_tool_call)
+
+
+def _run_research(
+    client: "AIClient",
+    messages: list[dict],
+    on_tool_call: Callable[[str, dict], None] | None,
+) -> str:
     return client.chat_with_tools(
         messages=messages,
         tools=TOOL_DEFINITIONS,
@@ -113,51 +276,44 @@ Use web_search to find current prices for gaps only, then return the findings.""
     )
 
 
-def generate_plan(
+def start_planning_research(
     client: "AIClient",
     state: ConversationState,
-    search_results: list[str],
-    user_interests: list[str],
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
     on_tool_call: Callable[[str, dict], None] | None = None,
     language_code: str | None = None,
-) -> str:
-    """Generate the travel itinerary (non-streaming)."""
-    planning_research = _gather_planning_research(
-        client,
+) -> "concurrent.futures.Future[str]":
+    """Start the planning research in the background.
+
+    Lets callers overlap it with other independent LLM work (e.g. updating
+    the assumptions) and hand the future to ``generate_plan``. The prompt is
+    built here, on the calling thread, so the background call works from a
+    snapshot and later changes to the state can't race with it.
+    """
+    messages = _research_messages(
         state,
         search_results,
         user_interests,
-        on_tool_call=on_tool_call,
-        language_code=language_code,
+        language_code,
+        RESEARCH_ONLY_INSTRUCTION,
     )
-    search_results.append(planning_research)
+    return _research_executor.submit(_run_research, client, messages, on_tool_call)
 
+
+def _structure_plan(
+    client: "AIClient",
+    state: ConversationState,
+    planning_research: str,
+    user_interests: MutableSequence[str],
+    language_code: str | None = None,
+    flight_costs: str = "",
+) -> TravelPlan:
+    """Turn already-gathered planning research into a structured TravelPlan."""
     vibe = state.vibe or (state.constraints.vibe if state.constraints else None)
     system_prompt = get_phase_prompt("planning", language_code, vibe=vibe)
     constraints_text = format_constraints(state)
-    assumptions_text = ""
-    if state.assumptions:
-        assumptions_text = "\n\nConfirmed Assumptions:\n"
-        for a in state.assumptions.assumptions:
-            assumptions_text += f"• {a}\n"
-
-    # Kick off flight search early if we have origin/destination
-    # This might have been done in agent.start(), but if not, do it here
-    if state.origin and state.destination:
-         # Try to extract year/month from constraints or date_context
-         flight_date_ctx = state.constraints.month_or_season if state.constraints else None
-         # We're inside generate_plan (non-streaming), so we don't have date_context variable available directly unless we call get_current_date_context()
-         if not flight_date_ctx:
-              flight_date_ctx = None
-              
-         # We aren't capturing the result here, just ensuring the future is submitted 
-         # in case it wasn't already. The agent.get_flight_costs() will retrieve it.
-         from app.agent.flight_search import search_flight_costs
-         # Note: Ideally this should be async or managed by the agent class, 
-         # but this is a stateless helper. We'll rely on the agent's pre-computation.
-         fc = search_flight_costs(state.origin, state.destination, flight_date_ctx)
-         if fc:
-             search_results.append(fc)
+    assumptions_text = format_confirmed_assumptions(state)
 
     interests_text = ""
     if user_interests:
@@ -165,26 +321,102 @@ def generate_plan(
 
     budget_currency = detect_budget_currency(state)
 
-    plan_prompt = f"""Create a structured day-by-day itinerary based on this information:
-
-{constraints_text}{assumptions_text}{interests_text}
-
-Research findings (use these for accurate cost estimates):
-{planning_research}
-
-CURRENCY: ALL prices MUST be in {budget_currency}."""
+    plan_prompt = PLAN_STRUCTURE_PROMPT_TEMPLATE.format(
+        constraints_text=constraints_text,
+        assumptions_text=assumptions_text,
+        interests_text=interests_text,
+        planning_research=planning_research,
+        flight_costs=flight_costs,
+        budget_currency=budget_currency,
+    )
 
     plan_messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": plan_prompt},
     ]
 
-    plan = client.chat_structured(plan_messages, TravelPlan, temperature=0.7)
+    return client.chat_structured(plan_messages, TravelPlan, temperature=0.7)
+
+
+def generate_plan(
+    client: "AIClient",
+    state: ConversationState,
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
+    on_tool_call: Callable[[str, dict], None] | None = None,
+    language_code: str | None = None,
+    research_future: "concurrent.futures.Future[str] | None" = None,
+    get_flight_costs: Callable[[], str] | None = None,
+) -> str:
+    """Generate the travel itinerary (non-streaming).
+
+    If ``research_future`` is given (see ``start_planning_research``), its
+    result is structured into the plan. Otherwise the research searches and
+    the structured plan come from a single chat_with_tools_structured call.
+    ``get_flight_costs`` returns the flight costs prefetched by the agent;
+    it is called only once the plan is about to be built, so the flight
+    search keeps running in the background until then.
+    """
+    if research_future is not None:
+        search_results.append(
+            trim_to_tokens(research_future.result(), RESEARCH_TOKEN_BUDGET)
+        )
+        # Structure from the new research plus what preceded it (e.g. the
+        # interest search), not the new research alone
+        plan = _structure_plan(
+            client,
+            state,
+            "\n\n".join(
+                trim_to_tokens(r, RESEARCH_TOKEN_BUDGET)
+                for r in list(search_results)[-3:]
+            ),
+            user_interests,
+            language_code,
+            flight_costs=get_flight_costs() if get_flight_costs else "",
+        )
+    elif not _needs_research(state, search_results, user_interests):
+        logger.info("Skipping planning research: stored research covers the trip")
+        plan = _structure_plan(
+            client,
+            state,
+            "\n\n".join(
+                trim_to_tokens(r, RESEARCH_TOKEN_BUDGET)
+                for r in list(search_results)[-3:]
+            ),
+            user_interests,
+            language_code,
+            flight_costs=get_flight_costs() if get_flight_costs else "",
+        )
+    else:
+        # Nothing was researched ahead of time: search and emit the
+        # structured plan in one pass instead of a prose research answer
+        # that is then re-read by a second structuring call.
+        messages = _research_messages(
+            state,
+            search_results,
+            user_interests,
+            language_code,
+            RESEARCH_AND_PLAN_INSTRUCTION,
+            flight_costs=get_flight_costs() if get_flight_costs else "",
+        )
+        plan, planning_research = client.chat_with_tools_structured(
+            messages=messages,
+            tools=TOOL_DEFINITIONS,
+            tool_executor=execute_tool,
+            response_format=TravelPlan,
+            temperature=0.7,
+            max_tool_calls=1,
+            on_tool_call=on_tool_call,
+        )
+        if planning_research:
+            search_results.append(
+                trim_to_tokens(planning_research, RESEARCH_TOKEN_BUDGET)
+            )
+
     state.current_plan = plan
     state.phase = Phase.REFINEMENT
 
-    response = format_plan(plan)
-    response += "\n\n---\nWant me to tweak anything? I can make it safer, faster, more comfortable, or change the base location. Or if you're happy with it, we're done!"
+    response = format_plan(plan) + REFINEMENT_MENU
 
     state.add_message("assistant", response)
     return response
@@ -193,8 +425,8 @@ CURRENCY: ALL prices MUST be in {budget_currency}."""
 def generate_plan_stream(
     client: "AIClient",
     state: ConversationState,
-    search_results: list[str],
-    user_interests: list[str],
+    search_results: MutableSequence[str],
+    user_interests: MutableSequence[str],
     on_tool_call: Callable[[str, dict], None] | None = None,
     language_code: str | None = None,
     flight_costs: str = "",
@@ -202,8 +434,7 @@ def generate_plan_stream(
     """Generate the travel itinerary with token streaming."""
     # FIX 1: Only do expensive research if we have NO prior search results
     # from the feasibility phase. This saves 5-15s of blocking time.
-    # FIX 1: Only do expensive research if we have NO prior search results
-    # from the feasibility phase. This saves 5-15s of blocking time.
+    # (_needs_research is stricter; it only ever decides to skip research.)
     if not search_results:
         planning_research = _gather_planning_research(
             client,
@@ -213,16 +444,14 @@ def generate_plan_stream(
             on_tool_call=on_tool_call,
             language_code=language_code,
         )
-        search_results.append(planning_research)
+        search_results.append(trim_to_tokens(planning_research, RESEARCH_TOKEN_BUDGET))
+    else:
+        logger.info("Skipping planning research: stored research covers the trip")
 
     vibe = state.vibe or (state.constraints.vibe if state.constraints else None)
     system_prompt = get_phase_prompt("planning", language_code, vibe=vibe)
     constraints_text = format_constraints(state)
-    assumptions_text = ""
-    if state.assumptions:
-        assumptions_text = "\n\nConfirmed Assumptions:\n"
-        for a in state.assumptions.assumptions:
-            assumptions_text += f"• {a}\n"
+    assumptions_text = format_confirmed_assumptions(state)
 
     interests_text = ""
     if user_interests:
@@ -231,76 +460,41 @@ def generate_plan_stream(
     budget_currency = detect_budget_currency(state)
 
     # Combine all prior research into the prompt
-    research_context = "\n\n".join(search_results[-5:]) if search_results else "No prior research available."
-
-    plan_prompt = f"""Create a detailed day-by-day itinerary based on this information:
-
-{constraints_text}{assumptions_text}{interests_text}
-
-Research findings (use these for accurate cost estimates):
-{research_context}
-
-{flight_costs}
-
-CURRENCY: ALL prices MUST be in {budget_currency}.
-
-FORMAT RULES (follow this EXACTLY):
-
-1. Start with an H1 title like "# 5-Day Itinerary for [Destination] Adventure"
-
-2. For each day use this format:
-## Day X: [Title]
-**Morning:** Activity description. Estimated cost: {budget_currency}X.
-**Noon/Afternoon/Evening:** Continue with specific activities.
-- Use **bold** for specific venue/restaurant names
-- Include estimated cost for EACH activity
-- Include specific timings where possible (e.g., "9:00 AM – 11:00 AM")
-
-**Tips:**
-- 2-4 practical tips per day (money-saving hacks, must-try food, hidden gems, important warnings)
-
-**Day X total:** Accommodation {budget_currency}X + Food {budget_currency}X + Activities {budget_currency}X + Transport {budget_currency}X = {budget_currency}X
-
-3. After all days, include:
-## Budget Breakdown
-- List each day's total
-- Show Total Spending
-- Show Budget Left (if under budget)
-
-## General Tips for Your Trip
-- Visa/entry requirements
-- SIM card / connectivity advice
-- Cultural etiquette
-- Essential apps to download
-- Money exchange tips
-- Packing essentials for the season
+    research_context = (
+        "\n\n".join(
+            trim_to_tokens(r, RESEARCH_TOKEN_BUDGET) for r in list(search_results)[-5:]
+        )
+        if search_results
+        else "No prior research available."
+    )
 
-QUALITY RULES:
-- Recommend SPECIFIC named hotels with neighborhood and per-night cost
-- Recommend SPECIFIC named restaurants for meals (not generic "lunch at a café")
-- Include realistic transport between locations with mode and cost
-- Every activity must have a cost estimate
-- Be concise but specific — 1-2 lines per activity, not paragraphs
-- Do NOT list generic "Breakfast", "Lunch", "Dinner" unless it's a famous food spot
-- Focus on specific places, things to do, and unique experiences"""
+    plan_prompt = PLAN_STREAM_PROMPT_TEMPLATE.format(
+        constraints_text=constraints_text,
+        assumptions_text=assumptions_text,
+        interests_text=interests_text,
+        research_context=research_context,
+        flight_costs=flight_costs,
+        budget_currency=budget_currency,
+    )
 
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": plan_prompt},
     ]
 
-    full_response = ""
+    chunks: list[str] = []
     # Stream tokens to the client in real-time
     for token in client.chat_stream(messages, temperature=0.7, max_tokens=5000):
-        full_response += token
+        chunks.append(token)
         yield token
+    full_response = "".join(chunks)
 
     # FIX 2: Fire-and-forget JSON structuring in background thread.
     # The user sees "done" immediately while we parse JSON behind the scenes.
     _bg_executor.submit(_parse_plan_bg, client, system_prompt, full_response, state)
     state.phase = Phase.REFINEMENT
 
-    extra = "\n\n---\nWant me to tweak anything? I can make it safer, faster, more comfortable, or change the base location. Or if you're happy with it, we're done!"
+    extra = REFINEMENT_MENU
     yield extra
     full_response += extra
     state.add_message("assistant", full_response)
@@ -1,5 +1,7 @@
 """System prompts for each phase of the travel planning agent."""
 
+from functools import lru_cache
+
 SYSTEM_PROMPT_BASE = """You are a friendly, knowledgeable travel planning assistant.
 
 You talk like a well-traveled friend — warm, direct, and helpful.
@@ -257,11 +259,15 @@ VIBE_PROMPTS = {
 }
 
 
+@lru_cache(maxsize=64)
 def get_phase_prompt(
     phase: str, language_code: str | None = None, vibe: str | None = None
 ) -> str:
     """Get the system prompt for a specific phase.
 
+    Pure function of its arguments, so results are memoized; it runs on
+    every phase call of every turn.
+
     Args:
         phase: The planning phase (clarification, feasibility, etc.)
         language_code: Optional user's preferred language code (e.g., 'fr', 'es')
@@ -270,15 +276,7 @@ def get_phase_prompt(
     Returns:
         Complete system prompt with language instruction if provided
     """
-    base_prompts = {
-        "clarification": f"{SYSTEM_PROMPT_BASE}\n\n{CLARIFICATION_PROMPT}",
-        "feasibility": f"{SYSTEM_PROMPT_BASE}\n\n{FEASIBILITY_PROMPT}",
-        "assumptions": f"{SYSTEM_PROMPT_BASE}\n\n{ASSUMPTIONS_PROMPT}",
-        "planning": f"{SYSTEM_PROMPT_BASE}\n\n{PLANNING_PROMPT}\n\nEXAMPLE GOOD ITINERARY:\n{EXAMPLE_ITINERARY}",
-        "refinement": f"{SYSTEM_PROMPT_BASE}\n\n{REFINEMENT_PROMPT}",
-    }
-
-    prompt = base_prompts.get(phase, SYSTEM_PROMPT_BASE)
+    prompt = PHASE_PROMPTS.get(phase, SYSTEM_PROMPT_BASE)
 
     # Inject Vibe instruction if present
     if vibe:
@@ -295,6 +293,29 @@ def get_phase_prompt(
     return prompt
 
 
+LANGUAGE_NAMES: dict[str, str] = {
+    "en": "English",
+    "fr": "French",
+    "es": "Spanish",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "nl": "Dutch",
+    "ru": "Russian",
+    "zh": "Chinese",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "ar": "Arabic",
+    "hi": "Hindi",
+    "tr": "Turkish",
+    "pl": "Polish",
+    "sv": "Swedish",
+    "no": "Norwegian",
+    "da": "Danish",
+    "fi": "Finnish",
+}
+
+
 def get_language_instruction(language_code: str) -> str:
     """Get the language instruction for the system prompt.
 
@@ -304,29 +325,7 @@ def get_language_instruction(language_code: str) -> str:
     Returns:
         Language instruction string for the system prompt
     """
-    language_names = {
-        "en": "English",
-        "fr": "French",
-        "es": "Spanish",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "nl": "Dutch",
-        "ru": "Russian",
-        "zh": "Chinese",
-        "ja": "Japanese",
-        "ko": "Korean",
-        "ar": "Arabic",
-        "hi": "Hindi",
-        "tr": "Turkish",
-        "pl": "Polish",
-        "sv": "Swedish",
-        "no": "Norwegian",
-        "da": "Danish",
-        "fi": "Finnish",
-    }
-
-    lang_name = language_names.get(language_code, language_code)
+    lang_name = LANGUAGE_NAMES.get(language_code, language_code)
     return f"\n\nLANGUAGE PREFERENCE: The user prefers to communicate in {lang_name} ({language_code}). ALL your responses MUST be in {lang_name}."
 
 
@@ -410,3 +409,14 @@ General Tips for Your Trip
 - Exchange some currency at home for better rates; ATMs in Japan may not accept foreign cards.
 - Pack layers, including a lightweight raincoat and comfortable walking shoes for exploring.
 """
+
+
+# Base system prompt per phase, assembled once at import. Defined last because
+# the planning prompt embeds EXAMPLE_ITINERARY above.
+PHASE_PROMPTS: dict[str, str] = {
+    "clarification": f"{SYSTEM_PROMPT_BASE}\n\n{CLARIFICATION_PROMPT}",
+    "feasibility": f"{SYSTEM_PROMPT_BASE}\n\n{FEASIBILITY_PROMPT}",
+    "assumptions": f"{SYSTEM_PROMPT_BASE}\n\n{ASSUMPTIONS_PROMPT}",
+    "planning": f"{SYSTEM_PROMPT_BASE}\n\n{PLANNING_PROMPT}\n\nEXAMPLE GOOD ITINERARY:\n{EXAMPLE_ITINERARY}",
+    "refinement": f"{SYSTEM_PROMPT_BASE}\n\n{REFINEMENT_PROMPT}",
+}
@@ -7,10 +7,13 @@ Multi-layered defense:
 4. Content normalization — strip invisible/control characters
 """
 
+import logging
 import re
 import unicodedata
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
+
 
 # ── Configuration ─────────────────────────────────────────────────────────────
 
@@ -67,12 +70,60 @@ _INJECTION_PATTERNS: list[tuple[re.Pattern, str]] = [
      "persistent instruction attempt"),
 ]
 
+# All patterns folded into one alternation so detection is a single scan;
+# group "pN" maps back to the reason of _INJECTION_PATTERNS[N].
+_INJECTION_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>{pattern.pattern})"
+        for i, (pattern, _) in enumerate(_INJECTION_PATTERNS)
+    ),
+    re.I,
+)
+# Group name -> (pattern index, reason)
+_INJECTION_GROUPS = {
+    f"p{i}": (i, reason) for i, (_, reason) in enumerate(_INJECTION_PATTERNS)
+}
+
+_RUN_OF_SPACES_RE = re.compile(r"[ \t]{10,}")
+_RUN_OF_NEWLINES_RE = re.compile(r"\n{5,}")
+
 # Unicode categories to strip (control chars, format chars, surrogates, etc.)
 _BANNED_UNICODE_CATEGORIES = {"Cc", "Cf", "Co", "Cs"}
 # But keep common whitespace
 _ALLOWED_CONTROL_CHARS = {"\n", "\r", "\t", " "}
 
 
+def _build_banned_chars_re() -> re.Pattern:
+    """Build a character class matching every banned codepoint.
+
+    The banned categories collapse into a few dozen codepoint ranges, so one
+    regex substitution replaces a per-character category lookup in Python.
+    """
+    ranges: list[tuple[int, int]] = []
+    for cp in range(0x110000):
+        ch = chr(cp)
+        if (
+            unicodedata.category(ch) not in _BANNED_UNICODE_CATEGORIES
+            or ch in _ALLOWED_CONTROL_CHARS
+        ):
+            continue
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1] = (ranges[-1][0], cp)
+        else:
+            ranges.append((cp, cp))
+    char_class = "".join(
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in ranges
+    )
+    return re.compile(f"[{char_class}]")
+
+
+# Built at import (a one-off scan of all codepoints, ~0.3s)
+_BANNED_CHARS_RE = _build_banned_chars_re()
+# The banned characters that can appear in ASCII text
+_ASCII_CONTROL_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]")
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 @dataclass
@@ -104,22 +155,23 @@ def sanitize_input(
     flags: list[str] = []
     modified = False
 
-    # 1. Normalize unicode (NFC) to prevent homoglyph attacks
-    cleaned = unicodedata.normalize("NFC", text)
+    cleaned = text
 
-    # 2. Strip invisible / control characters
-    stripped = []
-    for ch in cleaned:
-        cat = unicodedata.category(ch)
-        if cat in _BANNED_UNICODE_CATEGORIES and ch not in _ALLOWED_CONTROL_CHARS:
+    # Fast path for plain ASCII (most real input): NFC leaves it unchanged and
+    # the only banned characters it can hold are C0 controls and DEL.
+    if not cleaned.isascii() or _ASCII_CONTROL_RE.search(cleaned):
+        # 1. Normalize unicode (NFC) to prevent homoglyph attacks
+        cleaned = unicodedata.normalize("NFC", cleaned)
+
+        # 2. Strip invisible / control characters
+        stripped = _BANNED_CHARS_RE.sub("", cleaned)
+        if len(stripped) != len(cleaned):
             modified = True
-            continue
-        stripped.append(ch)
-    cleaned = "".join(stripped)
+            cleaned = stripped
 
     # 3. Collapse excessive whitespace (but preserve single newlines)
-    collapsed = re.sub(r"[ \t]{10,}", "  ", cleaned)
-    collapsed = re.sub(r"\n{5,}", "\n\n", collapsed)
+    collapsed = _RUN_OF_SPACES_RE.sub("  ", cleaned)
+    collapsed = _RUN_OF_NEWLINES_RE.sub("\n\n", collapsed)
     if collapsed != cleaned:
         modified = True
         cleaned = collapsed
@@ -131,11 +183,11 @@ def sanitize_input(
         modified = True
 
     # 5. Injection pattern detection
-    injection_detected = False
-    for pattern, reason in _INJECTION_PATTERNS:
-        if pattern.search(cleaned):
-            injection_detected = True
-            flags.append(reason)
+    matched = sorted(
+        {_INJECTION_GROUPS[m.lastgroup] for m in _INJECTION_RE.finditer(cleaned)}
+    )
+    injection_detected = bool(matched)
+    flags.extend(reason for _, reason in matched)
 
     if strict and injection_detected:
         raise ValueError(
@@ -150,6 +202,23 @@ def sanitize_input(
     )
 
 
+def log_injection(result: SanitizeResult, source: str) -> None:
+    """Log a suspected injection as a structured warning event.
+
+    Args:
+        result: Result returned by ``sanitize_input``.
+        source: Where the input came from (e.g. 'refinement'), for the log line.
+    """
+    if not result.injection_detected or not logger.isEnabledFor(logging.WARNING):
+        return
+    logger.warning(
+        "Possible prompt injection in %s: %s",
+        source,
+        result.flags,
+        extra={"injection_source": source, "injection_flags": result.flags},
+    )
+
+
 def wrap_user_content(text: str, label: str = "user_input") -> str:
     """Wrap user-provided text in delimiters for safe prompt inclusion.
 
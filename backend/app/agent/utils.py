@@ -1,19 +1,124 @@
 """Utility functions for the travel agent."""
 
-from datetime import datetime
+import re
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 from app.agent.models import ConversationState
 
 
+@lru_cache(maxsize=1)
+def _date_context_for(day: date) -> str:
+    return f"Today's date: {day:%B %d, %Y} (Year: {day.year})"
+
+
 def get_current_date_context() -> str:
     """Get current date context for prompts.
 
+    The string only changes once a day, so it is cached per calendar date.
+
     Returns:
         Formatted date string with year.
     """
-    now = datetime.now()
-    return f"Today's date: {now.strftime('%B %d, %Y')} (Year: {now.year})"
+    return _date_context_for(date.today())
+
+
+@lru_cache(maxsize=1)
+def _search_date_context_for(day: date) -> str:
+    return (
+        f"{_date_context_for(day)}\n"
+        f"Use the CURRENT YEAR ({day.year}) in all search queries, not past years."
+    )
+
+
+def get_search_date_context() -> str:
+    """Get the date context for research prompts that drive web searches.
+
+    Same as get_current_date_context, plus the current-year instruction for
+    search queries so the research prompts don't each repeat it.
+
+    Returns:
+        Formatted date string with the search-year instruction.
+    """
+    return _search_date_context_for(date.today())
+
+
+def get_current_year() -> int:
+    """Get the current year for search-query instructions."""
+    return date.today().year
+
+
+# Rough chars-per-token ratio for English text; avoids a tokenizer dependency
+# for the models served through OpenRouter.
+CHARS_PER_TOKEN = 4
+
+# Approximate token budget for a single research result, applied when it is
+# stored so stale web-search output can't bloat later prompts.
+RESEARCH_TOKEN_BUDGET = 1500
+
+
+def trim_to_tokens(text: str, max_tokens: int) -> str:
+    """Trim text to an approximate token budget.
+
+    Args:
+        text: Text to trim.
+        max_tokens: Approximate maximum number of tokens to keep.
+
+    Returns:
+        The text, cut at the last line break within the budget if it was too long.
+    """
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[: cut if cut > max_chars // 2 else max_chars] + "\n[...]"
+
+
+# Currency keywords, checked in priority order: the first currency with a hit
+# wins, so "USD 2000 (~₹1.6 lakh)" is INR, as before. Only letters count as a
+# boundary, so "Rs50000" and "EUR2000" match while "hours" and "ideas$" don't.
+# Prefixed dollars come before the bare "$" so "A$" is AUD.
+_NOT_LETTER_BEFORE = r"(?<![A-Za-z])"
+_NOT_LETTER_AFTER = r"(?![A-Za-z])"
+_CURRENCY_PATTERNS: dict[str, str] = {
+    "INR": rf"₹|{_NOT_LETTER_BEFORE}(?:INR|RS){_NOT_LETTER_AFTER}"
+    rf"|{_NOT_LETTER_BEFORE}(?:LAKH|RUPEE)",
+    "AUD": rf"{_NOT_LETTER_BEFORE}(?:A\$|AUD{_NOT_LETTER_AFTER})",
+    "CAD": rf"{_NOT_LETTER_BEFORE}(?:C\$|CAD{_NOT_LETTER_AFTER})",
+    "SGD": rf"{_NOT_LETTER_BEFORE}(?:S\$|SGD{_NOT_LETTER_AFTER})",
+    "USD": rf"\$|{_NOT_LETTER_BEFORE}(?:USD{_NOT_LETTER_AFTER}|DOLLAR)",
+    "EUR": rf"€|{_NOT_LETTER_BEFORE}(?:EUR{_NOT_LETTER_AFTER}|EURO)",
+    "JPY": rf"¥|{_NOT_LETTER_BEFORE}(?:JPY|YEN){_NOT_LETTER_AFTER}",
+    "GBP": rf"£|{_NOT_LETTER_BEFORE}(?:GBP{_NOT_LETTER_AFTER}|POUND)",
+    "THB": rf"{_NOT_LETTER_BEFORE}(?:THB{_NOT_LETTER_AFTER}|BAHT)",
+}
+_CURRENCY_RES = {
+    code: re.compile(alts, re.IGNORECASE)
+    for code, alts in _CURRENCY_PATTERNS.items()
+}
+
+
+@lru_cache(maxsize=256)
+def _find_currency(text: str) -> Optional[str]:
+    for code, pattern in _CURRENCY_RES.items():
+        if pattern.search(text):
+            return code
+    return None
+
+
+def mentions_currency(text: str, code: str) -> bool:
+    """Whether text mentions the given currency (e.g. prices in research).
+
+    Args:
+        text: Text to scan.
+        code: Currency code as returned by ``detect_budget_currency``.
+
+    Returns:
+        True if a symbol, code or name of the currency appears in the text.
+    """
+    pattern = _CURRENCY_RES.get(code)
+    return bool(pattern and pattern.search(text))
 
 
 def detect_budget_currency(state: ConversationState, current_input: Optional[str] = None) -> str:
@@ -29,32 +134,20 @@ def detect_budget_currency(state: ConversationState, current_input: Optional[str
     # Check current input first as it's the most recent preference
     search_targets = []
     if current_input:
-        search_targets.append(current_input.upper())
-    
+        search_targets.append(current_input)
+
     if state.constraints and state.constraints.budget:
-        search_targets.append(state.constraints.budget.upper())
-    
+        search_targets.append(state.constraints.budget)
+
     # If no budget info at all, check full conversation history for currency symbols
     if not search_targets:
         for msg in reversed(state.messages):
             if msg.role == "user":
-                search_targets.append(msg.content.upper())
-
-    currency_map = {
-        ("INR", "₹", "LAKH", "RUPEE", "RS"): "INR",
-        ("USD", "$", "DOLLAR"): "USD",
-        ("EUR", "€", "EURO"): "EUR",
-        ("JPY", "¥", "YEN"): "JPY",
-        ("GBP", "£", "POUND"): "GBP",
-        ("THB", "BAHT"): "THB",
-        ("AUD", "A$"): "AUD",
-        ("CAD", "C$"): "CAD",
-        ("SGD", "S$"): "SGD",
-    }
-    
+                search_targets.append(msg.content)
+
     for target in search_targets:
-        for keywords, code in currency_map.items():
-            if any(kw in target for kw in keywords):
-                return code
-                
+        code = _find_currency(target)
+        if code:
+            return code
+
     return "USD"
@@ -1,4 +1,4 @@
-"""Multi-provider web search with failover: Tavily → DuckDuckGo.
+"""Multi-provider web search with failover: Tavily → DuckDuckGo (hedged).
 
 Note: Brave Search API is commented out for now - can be enabled later.
 """
@@ -6,25 +6,26 @@ Note: Brave Search API is commented out for now - can be enabled later.
 import json
 import logging
 import os
+import threading
 from pathlib import Path
-from typing import Any
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Any, Callable, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError
 
-import requests
+import httpx
 from ddgs import DDGS
 from dotenv import load_dotenv
 
-from app.cache import cache
+from app.cache import memoize_two_tier
 
 # Load .env from project root (parent of backend/)
 env_path = Path(__file__).parent.parent.parent.parent / ".env"
 if env_path.exists():
     load_dotenv(env_path)
     logger = logging.getLogger(__name__)
-    logger.debug(f"[WEB SEARCH] Loaded .env from {env_path}")
+    logger.debug("[WEB SEARCH] Loaded .env from %s", env_path)
 else:
     logger = logging.getLogger(__name__)
-    logger.warning(f"[WEB SEARCH] .env not found at {env_path}")
+    logger.warning("[WEB SEARCH] .env not found at %s", env_path)
 
 # API Keys from environment
 # BRAVE_API_KEY = os.environ.get("BRAVE_API_KEY")  # Commented out for now
@@ -33,6 +34,44 @@ TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
 if not TAVILY_API_KEY:
     logger.warning("[WEB SEARCH] TAVILY_API_KEY not found in environment!")
 
+# Shared HTTP/2 client so concurrent searches multiplex over pooled
+# keep-alive connections instead of paying a TLS handshake per query.
+_tavily_client = httpx.Client(
+    base_url="https://api.tavily.com",
+    http2=True,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+)
+
+
+# Runs DDGS lookups so they can be abandoned after a timeout. Shared, because
+# a per-call `with ThreadPoolExecutor()` waits for the lookup on exit, which
+# made the timeout ineffective and spawned a thread per query.
+_ddgs_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="ddgs")
+
+# Runs provider calls for _search_with_failover so DDGS can be hedged
+# alongside a slow Tavily request.
+_search_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="search")
+
+# Seconds to wait on Tavily before also starting DDGS
+HEDGE_DELAY = 1.0
+
+# Searches currently running, keyed by (query, num_results), so concurrent
+# identical queries wait on one provider call instead of each making their own.
+_inflight: dict[tuple[str, int], Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _normalize_query(query: str) -> str:
+    """Canonicalize a query so trivial case/spacing variants share cache entries."""
+    return " ".join(query.lower().split())
+
+
+def close_search_client() -> None:
+    """Close the shared search clients (called on application shutdown)."""
+    _tavily_client.close()
+    _search_executor.shutdown(wait=False, cancel_futures=True)
+    _ddgs_executor.shutdown(wait=False, cancel_futures=True)
+
 
 # def brave_search(
 #     query: str, num_results: int = 5, timeout: int = 3
@@ -89,7 +128,7 @@ if not TAVILY_API_KEY:
 #         return None
 
 
-@cache.memoize(expire=86400)  # Cache for 24 hours
+@memoize_two_tier("tavily", expire=86400)  # Cache for 24 hours
 def tavily_search(
     query: str, num_results: int = 5, timeout: int = 3
 ) -> list[dict[str, str]] | None:
@@ -108,12 +147,9 @@ def tavily_search(
         return None
 
     try:
-        logger.info(f"[TAVILY] Searching: {query}")
-        response = requests.post(
-            "https://api.tavily.com/search",
-            headers={
-                "Content-Type": "application/json",
-            },
+        logger.info("[TAVILY] Searching: %s", query)
+        response = _tavily_client.post(
+            "/search",
             json={
                 "api_key": TAVILY_API_KEY,
                 "query": query,
@@ -135,18 +171,18 @@ def tavily_search(
                 }
             )
 
-        logger.info(f"[TAVILY] Found {len(results)} results for: {query}")
+        logger.info("[TAVILY] Found %s results for: %s", len(results), query)
         return results if results else None
 
-    except requests.Timeout:
-        logger.warning(f"[TAVILY] Timeout for query: {query}")
+    except httpx.TimeoutException:
+        logger.warning("[TAVILY] Timeout for query: %s", query)
         return None
     except Exception as e:
-        logger.error(f"[TAVILY] Error for query '{query}': {str(e)}")
+        logger.error("[TAVILY] Error for query '%s': %s", query, e)
         return None
 
 
-@cache.memoize(expire=86400)  # Cache for 24 hours
+@memoize_two_tier("ddgs", expire=86400)  # Cache for 24 hours
 def ddgs_search(
     query: str, num_results: int = 5, timeout: int = 5
 ) -> list[dict[str, str]] | None:
@@ -163,15 +199,18 @@ def ddgs_search(
     num_results = min(num_results, 5)
 
     try:
-        logger.info(f"[DDGS] Searching: {query}")
+        logger.info("[DDGS] Searching: %s", query)
 
         def _run() -> list[dict]:
             with DDGS() as ddgs:
                 return list(ddgs.text(query, max_results=num_results))
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_run)
+        future = _ddgs_executor.submit(_run)
+        try:
             results_raw = future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
 
         results = [
             {
@@ -182,14 +221,14 @@ def ddgs_search(
             for r in results_raw
         ]
 
-        logger.info(f"[DDGS] Found {len(results)} results for: {query}")
+        logger.info("[DDGS] Found %s results for: %s", len(results), query)
         return results if results else None
 
     except TimeoutError:
-        logger.warning(f"[DDGS] Timeout for query: {query}")
+        logger.warning("[DDGS] Timeout for query: %s", query)
         return None
     except Exception as e:
-        logger.error(f"[DDGS] Error for query '{query}': {str(e)}")
+        logger.error("[DDGS] Error for query '%s': %s", query, e)
         return None
 
 
@@ -199,6 +238,11 @@ def web_search(query: str, num_results: int = 3) -> list[dict[str, str]]:
     Order: Tavily → DuckDuckGo
     (Note: Brave is commented out for now)
 
+    Queries are normalized (lowercased, whitespace collapsed) first, so
+    trivial variants share the provider caches. Concurrent calls for the
+    same query share one provider lookup: the first caller runs it and the
+    others wait for its result.
+
     Args:
         query: Search query string.
         num_results: Number of results to return (max 10).
@@ -206,26 +250,82 @@ def web_search(query: str, num_results: int = 3) -> list[dict[str, str]]:
     Returns:
         List of search results with title, url, and snippet.
     """
-    logger.info(f"[WEB SEARCH] Query: {query}")
+    logger.info("[WEB SEARCH] Query: %s", query)
+    query = _normalize_query(query)
     num_results = min(num_results, 3)
 
+    key = (query, num_results)
+    with _inflight_lock:
+        pending = _inflight.get(key)
+        if pending is None:
+            future = Future()
+            _inflight[key] = future
+    if pending is not None:
+        logger.info("[WEB SEARCH] Joining in-flight search for: %s", query)
+        return pending.result()
+
+    try:
+        results = _search_with_failover(query, num_results)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(results)
+        return results
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _search_with_failover(query: str, num_results: int) -> list[dict[str, str]]:
+    """Query Tavily, hedged with DDGS if Tavily is slow to answer.
+
+    Tavily results are preferred. If Tavily hasn't answered within
+    HEDGE_DELAY seconds, DDGS is started alongside it, so a Tavily timeout
+    or failure no longer adds its full latency in front of the fallback.
+    """
+    tavily = _search_executor.submit(tavily_search, query, num_results)
+    ddgs: Optional[Future] = None
+    try:
+        tavily.result(timeout=HEDGE_DELAY)
+    except TimeoutError:
+        ddgs = _search_executor.submit(ddgs_search, query, num_results)
+
     # Try Tavily first (primary)
-    results = tavily_search(query, num_results)
+    results = tavily.result()
     if results:
-        logger.info(f"[WEB SEARCH] Using TAVILY results for: {query}")
+        logger.info("[WEB SEARCH] Using TAVILY results for: %s", query)
         return results
 
     # Fallback to DuckDuckGo
-    results = ddgs_search(query, num_results)
+    if ddgs is None:
+        ddgs = _search_executor.submit(ddgs_search, query, num_results)
+    results = ddgs.result()
     if results:
-        logger.info(f"[WEB SEARCH] Using DDGS results for: {query}")
+        logger.info("[WEB SEARCH] Using DDGS results for: %s", query)
         return results
 
     # All failed
-    logger.error(f"[WEB SEARCH] All providers failed for query: {query}")
+    logger.error("[WEB SEARCH] All providers failed for query: %s", query)
     return [{"error": "All search providers failed. Proceed with estimates."}]
 
 
+def _run_web_search(arguments: dict[str, Any]) -> str:
+    query = arguments.get("query", "")
+    logger.info("[TOOL CALL] Executing web_search with query: %s", query)
+    results = web_search(
+        query=query,
+        num_results=arguments.get("num_results", 5),
+    )
+    return json.dumps(results)
+
+
+# Tool name -> handler taking the call's arguments and returning JSON
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    "web_search": _run_web_search,
+}
+
+
 def execute_tool(tool_name: str, arguments: dict[str, Any]) -> str:
     """Execute a tool by name with given arguments.
 
@@ -236,16 +336,11 @@ def execute_tool(tool_name: str, arguments: dict[str, Any]) -> str:
     Returns:
         JSON string of tool results.
     """
-    if tool_name == "web_search":
-        query = arguments.get("query", "")
-        logger.info(f"[TOOL CALL] Executing {tool_name} with query: {query}")
-        results = web_search(
-            query=query,
-            num_results=arguments.get("num_results", 5),
-        )
-        return json.dumps(results, indent=2)
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is not None:
+        return handler(arguments)
 
-    logger.warning(f"[TOOL CALL] Unknown tool requested: {tool_name}")
+    logger.warning("[TOOL CALL] Unknown tool requested: %s", tool_name)
     return json.dumps({"error": f"Unknown tool: {tool_name}"})
 
 
@@ -264,11 +359,8 @@ def format_search_results(results: list[dict[str, str]]) -> str:
     if "error" in results[0]:
         return f"Search error: {results[0]['error']}"
 
-    lines = []
-    for i, r in enumerate(results, 1):
-        lines.append(f"{i}. **{r['title']}**")
-        lines.append(f"   {r['snippet']}")
-        lines.append(f"   Source: {r['url']}")
-        lines.append("")
-
-    return "\n".join(lines)
+    entries = "\n\n".join(
+        f"{i}. **{r['title']}**\n   {r['snippet']}\n   Source: {r['url']}"
+        for i, r in enumerate(results, 1)
+    )
+    return entries + "\n"
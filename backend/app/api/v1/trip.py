@@ -20,17 +20,18 @@ CRUD
   DELETE /trips/{id}             → Delete trip + versions + session
 """
 
-from typing import Annotated, AsyncGenerator, Callable, Optional
-import json
+from typing import Annotated, Any, AsyncGenerator, Callable, Optional
 import asyncio
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, status, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.api.v1.trip_streaming import relay_agent_stream
 from app.db.models import User
 from app.schemas.trip import (
     AgentResponse,
@@ -44,9 +45,9 @@ from app.services import trip as trip_service
 router = APIRouter(prefix="/trips", tags=["trips"])
 
 
-def _chunk_text(text: str, size: int = 8) -> list[str]:
-    """Split text into smaller chunks for smoother streaming."""
-    return [text[i : i + size] for i in range(0, len(text), size)]
+def _sse(event: str, payload: dict[str, Any]) -> bytes:
+    """Format one server-sent event as bytes, ready for StreamingResponse."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
 
 
 def _make_status_callback(status_queue: asyncio.Queue[str]) -> Callable[[str], None]:
@@ -60,22 +61,21 @@ def _make_status_callback(status_queue: asyncio.Queue[str]) -> Callable[[str], N
 
 async def _stream_agent_response(
     response: AgentResponse,
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     meta = {
         "trip_id": str(response.trip_id) if response.trip_id else None,
         "version_id": str(response.version_id) if response.version_id else None,
         "phase": response.phase,
         "has_high_risk": response.has_high_risk,
     }
-    yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+    yield _sse("meta", meta)
 
-    # Stream the response with minimal delay for token-like feel
-    for chunk in _chunk_text(response.message):
-        payload = json.dumps({"text": chunk})
-        yield f"event: delta\ndata: {payload}\n\n"
-        await asyncio.sleep(0.02)  # 20ms delay for smooth streaming
+    # The message is already complete, so send it in one delta instead of
+    # replaying it in paced chunks (which added ~2.5s per 1000 characters).
+    # Real token streaming lives in the /token-stream endpoints.
+    yield _sse("delta", {"text": response.message})
 
-    yield "event: done\ndata: {}\n\n"
+    yield b"event: done\ndata: {}\n\n"
 
 
 # ---------------------------------------------------------------------------
@@ -188,33 +188,34 @@ async def start_trip_stream(
             on_status=_make_status_callback(status_queue),
         )
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
             while not task.done():
                 try:
                     status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
                 except asyncio.TimeoutError:
                     continue
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield _sse("error", error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -255,33 +256,34 @@ async def clarify_trip_stream(
             on_status=_make_status_callback(status_queue),
         )
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
             while not task.done():
                 try:
                     status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
                 except asyncio.TimeoutError:
                     continue
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield _sse("error", error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -323,33 +325,34 @@ async def proceed_trip_stream(
             on_status=_make_status_callback(status_queue),
         )
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
             while not task.done():
                 try:
                     status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
                 except asyncio.TimeoutError:
                     continue
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield _sse("error", error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -396,33 +399,34 @@ async def confirm_assumptions_stream(
             on_status=_make_status_callback(status_queue),
         )
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
             while not task.done():
                 try:
                     status_msg = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
                 except asyncio.TimeoutError:
                     continue
 
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield _sse("error", error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -461,14 +465,13 @@ async def refine_trip_stream(
             on_status=_make_status_callback(status_queue),
         )
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         task = asyncio.create_task(runner())
         try:
             while not task.done():
                 try:
                     status = await asyncio.wait_for(status_queue.get(), timeout=0.2)
-                    payload = json.dumps({"text": status})
-                    yield f"event: status\ndata: {payload}\n\n"
+                    yield _sse("status", {"text": status})
                 except asyncio.TimeoutError:
                     continue
 
@@ -476,20 +479,21 @@ async def refine_trip_stream(
             if task.exception():
                 exc = task.exception()
                 if isinstance(exc, HTTPException):
-                    error_payload = json.dumps(
-                        {"error": exc.detail, "status_code": exc.status_code}
-                    )
+                    error_payload = {
+                        "error": exc.detail,
+                        "status_code": exc.status_code,
+                    }
                 else:
-                    error_payload = json.dumps({"error": str(exc), "status_code": 500})
-                yield f"event: error\ndata: {error_payload}\n\n"
+                    error_payload = {"error": str(exc), "status_code": 500}
+                yield _sse("error", error_payload)
                 return
 
             response = await task
             async for chunk in _stream_agent_response(response):
                 yield chunk
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -499,6 +503,62 @@ async def refine_trip_stream(
 # ---------------------------------------------------------------------------
 
 
+@router.post("/start/token-stream")
+async def start_trip_token_stream(
+    body: StartTripRequest,
+    current_user: Annotated[User, Depends(get_current_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> StreamingResponse:
+    """Start a new trip planning conversation with token-by-token streaming.
+
+    The trip is created once the stream completes, so ``trip_id`` arrives in
+    the final ``meta`` event (``null`` if origin/destination are missing).
+    """
+    # Early rate-limit check for free users to return a proper 429
+    await trip_service._enforce_plan_limit(db, current_user.id)
+
+    async def generator() -> AsyncGenerator[bytes, None]:
+        try:
+            agent = await trip_service.new_agent(db, current_user.id, vibe=body.vibe)
+
+            meta = {
+                "trip_id": None,
+                "version_id": None,
+                "phase": agent.state.phase.value,
+                "has_high_risk": False,
+            }
+            yield _sse("meta", meta)
+
+            chunks: list[str] = []
+            async for event in relay_agent_stream(
+                agent, lambda a: a.start_stream(body.prompt), chunks
+            ):
+                yield event
+
+            # Create the trip and register the session
+            response = await trip_service.open_trip_session(
+                db, current_user.id, agent, body.prompt, "".join(chunks)
+            )
+
+            final_meta = {
+                "trip_id": str(response.trip_id) if response.trip_id else None,
+                "version_id": str(response.version_id) if response.version_id else None,
+                "phase": response.phase,
+                "has_high_risk": False,
+            }
+            yield _sse("meta", final_meta)
+
+            yield b"event: done\ndata: {}\n\n"
+
+        except HTTPException as e:
+            yield _sse("error", {"error": e.detail, "status_code": e.status_code})
+        except Exception as e:
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
+
+    return StreamingResponse(generator(), media_type="text/event-stream")
+
+
 @router.post("/{trip_id}/clarify/token-stream")
 async def clarify_trip_token_stream(
     trip_id: UUID,
@@ -510,7 +570,7 @@ async def clarify_trip_token_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
@@ -524,7 +584,7 @@ async def clarify_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield _sse("meta", meta)
 
             loop = asyncio.get_running_loop()
             agent.on_status = _make_status_callback(status_queue)
@@ -542,11 +602,11 @@ async def clarify_trip_token_stream(
             while not task.done() or not status_queue.empty() or not token_queue.empty():
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield _sse("token", {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -554,12 +614,8 @@ async def clarify_trip_token_stream(
                 raise task.exception()
 
             # Finalize and persist
-            await trip_service._persist_state(db, version, agent)
-            await trip_service._store_message(
-                db, trip_id, "user", body.answers, phase=agent.state.phase.value
-            )
-            await trip_service._store_message(
-                db, trip_id, "assistant", full_response, phase=agent.state.phase.value
+            await trip_service.persist_turn(
+                db, version, agent, body.answers, full_response
             )
 
             # Send FINAL meta with updated phase
@@ -569,13 +625,13 @@ async def clarify_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": agent.state.phase.value == "feasibility" and agent.state.awaiting_confirmation,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield _sse("meta", final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield b"event: done\ndata: {}\n\n"
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -591,7 +647,7 @@ async def proceed_trip_token_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue()
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
@@ -617,18 +673,18 @@ async def proceed_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield _sse("meta", meta)
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
             while not task.done() or not status_queue.empty() or not token_queue.empty():
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield _sse("token", {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -636,13 +692,9 @@ async def proceed_trip_token_stream(
                 raise task.exception()
 
             # Finalize and persist
-            await trip_service._persist_state(db, version, agent)
             user_message = "Let's proceed anyway." if body.proceed else "Let me reconsider."
-            await trip_service._store_message(
-                db, trip_id, "user", user_message, phase=agent.state.phase.value
-            )
-            await trip_service._store_message(
-                db, trip_id, "assistant", full_response, phase=agent.state.phase.value
+            await trip_service.persist_turn(
+                db, version, agent, user_message, full_response
             )
 
             # Send FINAL meta with updated phase
@@ -652,13 +704,13 @@ async def proceed_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield _sse("meta", final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield b"event: done\ndata: {}\n\n"
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -674,7 +726,7 @@ async def confirm_assumptions_token_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue[str]()
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
@@ -704,23 +756,23 @@ async def confirm_assumptions_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield _sse("meta", meta)
 
             # Send destination images if available (for carousel)
             dest_images = agent.get_destination_images()
             if dest_images:
-                yield f"event: images\ndata: {json.dumps({'images': dest_images})}\n\n"
+                yield _sse("images", {'images': dest_images})
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
             while not task.done() or not status_queue.empty() or not token_queue.empty():
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield _sse("token", {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -728,8 +780,6 @@ async def confirm_assumptions_token_stream(
                 raise task.exception()
 
             # Finalize and persist
-            await trip_service._persist_state(db, version, agent)
-
             if (
                 body.confirmed
                 and not body.modifications
@@ -744,11 +794,8 @@ async def confirm_assumptions_token_stream(
                     parts.append(body.additional_interests)
                 user_message = " ".join(parts).strip() or "Update assumptions."
 
-            await trip_service._store_message(
-                db, trip_id, "user", user_message, phase=agent.state.phase.value
-            )
-            await trip_service._store_message(
-                db, trip_id, "assistant", full_response, phase=agent.state.phase.value
+            await trip_service.persist_turn(
+                db, version, agent, user_message, full_response
             )
 
             # Send FINAL meta with updated phase
@@ -758,13 +805,13 @@ async def confirm_assumptions_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield _sse("meta", final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield b"event: done\ndata: {}\n\n"
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
@@ -780,7 +827,7 @@ async def refine_trip_token_stream(
     status_queue: asyncio.Queue[str] = asyncio.Queue[str]()
     token_queue: asyncio.Queue[str] = asyncio.Queue[str]()
 
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
         try:
             # Ownership and validity check
             await trip_service._get_user_trip(db, trip_id, current_user.id)
@@ -806,18 +853,18 @@ async def refine_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(meta)}\n\n"
+            yield _sse("meta", meta)
 
             task = asyncio.create_task(asyncio.to_thread(run))
 
             while not task.done() or not status_queue.empty() or not token_queue.empty():
                 while not status_queue.empty():
                     status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
+                    yield _sse("status", {"text": status_msg})
 
                 while not token_queue.empty():
                     token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
+                    yield _sse("token", {"text": token})
 
                 await asyncio.sleep(0.02)
 
@@ -825,12 +872,8 @@ async def refine_trip_token_stream(
                 raise task.exception()
 
             # Finalize and persist
-            await trip_service._persist_state(db, version, agent)
-            await trip_service._store_message(
-                db, trip_id, "user", body.refinement_type, phase=agent.state.phase.value
-            )
-            await trip_service._store_message(
-                db, trip_id, "assistant", full_response, phase=agent.state.phase.value
+            await trip_service.persist_turn(
+                db, version, agent, body.refinement_type, full_response
             )
 
             # Send FINAL meta with updated phase
@@ -840,13 +883,13 @@ async def refine_trip_token_stream(
                 "phase": agent.state.phase.value,
                 "has_high_risk": False,
             }
-            yield f"event: meta\ndata: {json.dumps(final_meta)}\n\n"
+            yield _sse("meta", final_meta)
 
-            yield "event: done\ndata: {}\n\n"
+            yield b"event: done\ndata: {}\n\n"
 
         except Exception as e:
-            error_payload = json.dumps({"error": str(e), "status_code": 500})
-            yield f"event: error\ndata: {error_payload}\n\n"
+            error_payload = {"error": str(e), "status_code": 500}
+            yield _sse("error", error_payload)
 
     return StreamingResponse(generator(), media_type="text/event-stream")
 
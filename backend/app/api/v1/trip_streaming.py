@@ -1,10 +1,12 @@
 """Streaming trip API endpoints for token-by-token responses with phase tracking."""
 
 import asyncio
-import json
-from typing import Annotated, AsyncGenerator, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any, AsyncGenerator, Callable, Iterator
 from uuid import UUID
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import StreamingResponse
 
@@ -17,23 +19,144 @@ from app.db.models import User
 router = APIRouter(prefix="/trips", tags=["trips-streaming"])
 settings = get_settings()
 
+# Token streams hold a thread for a whole LLM response; keep them off the
+# default executor so they can't starve the short asyncio.to_thread calls.
+_stream_executor = ThreadPoolExecutor(
+    max_workers=settings.agent_worker_threads, thread_name_prefix="agent-stream"
+)
+
+# Worker-thread events are handed to the event loop at most once per this
+# many seconds, instead of one cross-thread wakeup per token.
+_STREAM_FLUSH_INTERVAL = 0.005
+
+
+def close_stream_executor() -> None:
+    """Stop the token-stream worker pool (called on application shutdown)."""
+    _stream_executor.shutdown(wait=False, cancel_futures=True)
 
-def _make_status_callback(status_queue: asyncio.Queue[str]) -> Callable[[str], None]:
-    loop = asyncio.get_running_loop()
 
-    def _cb(message: str) -> None:
-        loop.call_soon_threadsafe(status_queue.put_nowait, message)
+def _sse(event: str, payload: dict[str, Any]) -> bytes:
+    """Format one server-sent event as bytes, ready for StreamingResponse."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
 
-    return _cb
 
+async def relay_agent_stream(
+    agent: TravelAgent,
+    run: Callable[[TravelAgent], Iterator[str]],
+    chunks: list[str] | None = None,
+    initial_phase: Phase | None = None,
+) -> AsyncGenerator[bytes, None]:
+    """Run an agent token stream in a worker thread and relay it as SSE.
 
-def _make_token_callback(token_queue: asyncio.Queue[str]) -> Callable[[str], None]:
+    Yields a ``meta`` event whenever the agent's phase changes, ``status``
+    events from the agent's status callback and one ``token`` event per
+    streamed chunk, in the order they were produced. Errors from the agent
+    propagate to the caller, which sends ``done`` or ``error``.
+
+    Args:
+        agent: Agent to run; its status callback is routed into the stream.
+        run: Starts the agent's token stream, e.g. ``agent.start_stream(prompt)``.
+        chunks: If given, every streamed token is also appended to it, so
+            the caller can join the full reply once the stream ends.
+        initial_phase: Phase the client was last told about; defaults to the
+            agent's current phase.
+    """
     loop = asyncio.get_running_loop()
+    # (event name, value) pairs from the worker thread, in production order
+    events: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+
+    # Events produced by the worker since the last flush
+    pending: list[tuple[str, str]] = []
+    pending_lock = threading.Lock()
+
+    def flush() -> None:
+        with pending_lock:
+            batch = pending[:]
+            pending.clear()
+        for item in batch:
+            events.put_nowait(item)
+
+    def push(name: str, value: str) -> None:
+        with pending_lock:
+            pending.append((name, value))
+            schedule = len(pending) == 1
+        if schedule:
+            loop.call_soon_threadsafe(loop.call_later, _STREAM_FLUSH_INTERVAL, flush)
+
+    agent.on_status = lambda message: push("status", message)
+
+    def run_stream() -> None:
+        last_phase = (initial_phase or agent.state.phase).value
+        try:
+            for token in run(agent):
+                phase = agent.state.phase.value
+                if phase != last_phase:
+                    last_phase = phase
+                    push("meta", phase)
+                if chunks is not None:
+                    chunks.append(token)
+                push("token", token)
+        finally:
+            # Deliver the tail before the task's completion is observed
+            loop.call_soon_threadsafe(flush)
+
+    def event(name: str, value: str) -> bytes:
+        if name == "meta":
+            return _sse("meta", {"phase": value, "has_high_risk": False})
+        return _sse(name, {"text": value})
+
+    task = asyncio.ensure_future(loop.run_in_executor(_stream_executor, run_stream))
+    getter = asyncio.create_task(events.get())
+
+    try:
+        while not task.done():
+            done, _ = await asyncio.wait(
+                {getter, task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if getter in done:
+                yield event(*getter.result())
+                while not events.empty():
+                    yield event(*events.get_nowait())
+                getter = asyncio.create_task(events.get())
+
+        # The worker's final flush lands before its future resolves;
+        # deliver whatever the getter hasn't yet.
+        if getter.done():
+            yield event(*getter.result())
+        else:
+            getter.cancel()
+        while not events.empty():
+            yield event(*events.get_nowait())
+
+        await task
+    finally:
+        getter.cancel()
+
+
+def _stream_phase(
+    initial_phase: Phase, run: Callable[[TravelAgent], Iterator[str]]
+) -> StreamingResponse:
+    """Stream one agent phase as SSE: ``meta``, relayed events, then ``done``.
 
-    def _cb(token: str) -> None:
-        loop.call_soon_threadsafe(token_queue.put_nowait, token)
+    Args:
+        initial_phase: Phase reported before the agent starts.
+        run: Starts the agent's token stream, e.g. ``agent.start_stream(prompt)``.
+    """
+
+    async def generator() -> AsyncGenerator[bytes, None]:
+        agent = TravelAgent(api_key=settings.openrouter_api_key)
 
-    return _cb
+        yield _sse("meta", {"phase": initial_phase.value, "has_high_risk": False})
+        try:
+            async for chunk in relay_agent_stream(
+                agent, run, initial_phase=initial_phase
+            ):
+                yield chunk
+            yield b"event: done\ndata: {}\n\n"
+        except Exception as e:
+            yield _sse("error", {"error": str(e)})
+
+    return StreamingResponse(generator(), media_type="text/event-stream")
 
 
 @router.post("/start-stream")
@@ -49,62 +172,9 @@ async def start_trip_stream(
     if not prompt:
         raise HTTPException(status_code=400, detail="Prompt is required")
 
-    token_queue: asyncio.Queue[str] = asyncio.Queue()
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
-    phase_queue: asyncio.Queue[str] = asyncio.Queue()
-
-    async def generator() -> AsyncGenerator[str, None]:
-        agent = TravelAgent(
-            api_key=settings.openrouter_api_key,
-            on_status=_make_status_callback(status_queue),
-            on_token=_make_token_callback(token_queue),
-        )
-
-        yield f"event: meta\ndata: {json.dumps({'phase': 'clarification', 'has_high_risk': False})}\n\n"
-
-        loop = asyncio.get_event_loop()
-
-        def run_stream():
-            phase_queue.put_nowait(Phase.CLARIFICATION.value)
-            for token in agent.start_stream(prompt):
-                phase_queue.put_nowait(agent.state.phase.value)
-
-        task = loop.run_in_executor(None, run_stream)
-
-        try:
-            current_phase = Phase.CLARIFICATION.value
-
-            while not task.done():
-                try:
-                    new_phase = phase_queue.get_nowait()
-                    if new_phase != current_phase:
-                        current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-                except asyncio.QueueEmpty:
-                    await asyncio.sleep(0.01)
-
-            while not token_queue.empty():
-                token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-
-            yield "event: done\ndata: {}\n\n"
-
-        except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return _stream_phase(
+        Phase.CLARIFICATION, lambda agent: agent.start_stream(prompt)
+    )
 
 
 @router.post("/{trip_id}/clarify-stream")
@@ -121,62 +191,9 @@ async def clarify_trip_stream(
     if not answers:
         raise HTTPException(status_code=400, detail="Answers are required")
 
-    token_queue: asyncio.Queue[str] = asyncio.Queue()
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
-    phase_queue: asyncio.Queue[str] = asyncio.Queue()
-
-    async def generator() -> AsyncGenerator[str, None]:
-        agent = TravelAgent(
-            api_key=settings.openrouter_api_key,
-            on_status=_make_status_callback(status_queue),
-            on_token=_make_token_callback(token_queue),
-        )
-
-        yield f"event: meta\ndata: {json.dumps({'phase': 'feasibility', 'has_high_risk': False})}\n\n"
-
-        loop = asyncio.get_event_loop()
-
-        def run_stream():
-            phase_queue.put_nowait(Phase.FEASIBILITY.value)
-            for token in agent.clarify_stream(answers):
-                phase_queue.put_nowait(agent.state.phase.value)
-
-        task = loop.run_in_executor(None, run_stream)
-
-        try:
-            current_phase = Phase.FEASIBILITY.value
-
-            while not task.done():
-                try:
-                    new_phase = phase_queue.get_nowait()
-                    if new_phase != current_phase:
-                        current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-                except asyncio.QueueEmpty:
-                    await asyncio.sleep(0.01)
-
-            while not token_queue.empty():
-                token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-
-            yield "event: done\ndata: {}\n\n"
-
-        except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return _stream_phase(
+        Phase.FEASIBILITY, lambda agent: agent.process_clarification_stream(answers)
+    )
 
 
 @router.post("/{trip_id}/plan-stream")
@@ -191,64 +208,12 @@ async def generate_plan_stream(
     """
     modifications = request.get("modifications")
 
-    token_queue: asyncio.Queue[str] = asyncio.Queue()
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
-    phase_queue: asyncio.Queue[str] = asyncio.Queue()
-
-    async def generator() -> AsyncGenerator[str, None]:
-        agent = TravelAgent(
-            api_key=settings.openrouter_api_key,
-            on_status=_make_status_callback(status_queue),
-            on_token=_make_token_callback(token_queue),
-        )
-
-        yield f"event: meta\ndata: {json.dumps({'phase': 'planning', 'has_high_risk': False})}\n\n"
-
-        loop = asyncio.get_event_loop()
-
-        def run_stream():
-            phase_queue.put_nowait(Phase.PLANNING.value)
-            for token in agent.assumptions_stream(
-                confirmed=True, modifications=modifications
-            ):
-                phase_queue.put_nowait(agent.state.phase.value)
-
-        task = loop.run_in_executor(None, run_stream)
-
-        try:
-            current_phase = Phase.PLANNING.value
-
-            while not task.done():
-                try:
-                    new_phase = phase_queue.get_nowait()
-                    if new_phase != current_phase:
-                        current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-                except asyncio.QueueEmpty:
-                    await asyncio.sleep(0.01)
-
-            while not token_queue.empty():
-                token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-
-            yield "event: done\ndata: {}\n\n"
-
-        except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return _stream_phase(
+        Phase.PLANNING,
+        lambda agent: agent.confirm_assumptions_stream(
+            confirmed=True, modifications=modifications
+        ),
+    )
 
 
 @router.post("/{trip_id}/refine-stream-token")
@@ -265,59 +230,6 @@ async def refine_plan_token_stream(
     if not refinement_type:
         raise HTTPException(status_code=400, detail="Refinement type is required")
 
-    token_queue: asyncio.Queue[str] = asyncio.Queue()
-    status_queue: asyncio.Queue[str] = asyncio.Queue()
-    phase_queue: asyncio.Queue[str] = asyncio.Queue()
-
-    async def generator() -> AsyncGenerator[str, None]:
-        agent = TravelAgent(
-            api_key=settings.openrouter_api_key,
-            on_status=_make_status_callback(status_queue),
-            on_token=_make_token_callback(token_queue),
-        )
-
-        yield f"event: meta\ndata: {json.dumps({'phase': 'refinement', 'has_high_risk': False})}\n\n"
-
-        loop = asyncio.get_event_loop()
-
-        def run_stream():
-            phase_queue.put_nowait(Phase.REFINEMENT.value)
-            for token in agent.refine_stream(refinement_type):
-                phase_queue.put_nowait(agent.state.phase.value)
-
-        task = loop.run_in_executor(None, run_stream)
-
-        try:
-            current_phase = Phase.REFINEMENT.value
-
-            while not task.done():
-                try:
-                    new_phase = phase_queue.get_nowait()
-                    if new_phase != current_phase:
-                        current_phase = new_phase
-                        yield f"event: meta\ndata: {json.dumps({'phase': current_phase, 'has_high_risk': False})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    status_msg = status_queue.get_nowait()
-                    yield f"event: status\ndata: {json.dumps({'text': status_msg})}\n\n"
-                except asyncio.QueueEmpty:
-                    pass
-
-                try:
-                    token = token_queue.get_nowait()
-                    yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-                except asyncio.QueueEmpty:
-                    await asyncio.sleep(0.01)
-
-            while not token_queue.empty():
-                token = token_queue.get_nowait()
-                yield f"event: token\ndata: {json.dumps({'text': token})}\n\n"
-
-            yield "event: done\ndata: {}\n\n"
-
-        except Exception as e:
-            yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-
-    return StreamingResponse(generator(), media_type="text/event-stream")
+    return _stream_phase(
+        Phase.REFINEMENT, lambda agent: agent.refine_plan_stream(refinement_type)
+    )
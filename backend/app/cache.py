@@ -1,13 +1,122 @@
 
+import functools
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from diskcache import Cache
+from typing import Any, Callable, Hashable
+
+import orjson
+from diskcache import UNKNOWN, Cache, Disk
+
+# Marks values stored as orjson rather than pickle
+_JSON_PREFIX = b"\x00orjson\x00"
+
+
+class OrjsonDisk(Disk):
+    """diskcache Disk that stores dict/list values as JSON instead of pickle.
+
+    Search results and cached LLM payloads are small dicts/lists of strings,
+    where orjson is several times faster than pickle and more compact.
+    Anything else (and entries written before this existed) goes through
+    the default pickle path.
+    """
+
+    def store(self, value: Any, read: bool, key: Any = UNKNOWN) -> tuple:
+        if not read and isinstance(value, (dict, list)):
+            try:
+                value = _JSON_PREFIX + orjson.dumps(value)
+            except TypeError:
+                pass
+        return super().store(value, read, key=key)
+
+    def fetch(self, mode: int, filename: str, value: Any, read: bool) -> Any:
+        data = super().fetch(mode, filename, value, read)
+        if isinstance(data, bytes) and data.startswith(_JSON_PREFIX):
+            return orjson.loads(data[len(_JSON_PREFIX) :])
+        return data
+
 
 # Use a local .cache directory in the project root
 # This path is relative to where the app is run (usually backend/)
 CACHE_DIR = Path(os.getcwd()) / ".cache" / "web_search"
 
 # Initialize disk cache
-# Size limit: 1GB
+# Size limit: 128MB (entries are a few KB of search results each)
 # Eviction policy: Least Recently Used (LRU)
-cache = Cache(directory=str(CACHE_DIR), size_limit=1024 * 1024 * 1024)
+cache = Cache(
+    directory=str(CACHE_DIR), size_limit=128 * 1024 * 1024, disk=OrjsonDisk
+)
+
+# Separate cache for deterministic (low-temperature) LLM completions
+LLM_CACHE_DIR = Path(os.getcwd()) / ".cache" / "llm"
+llm_cache = Cache(
+    directory=str(LLM_CACHE_DIR), size_limit=512 * 1024 * 1024, disk=OrjsonDisk
+)
+
+
+class TTLCache:
+    """Small thread-safe in-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, expire: float) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + expire)
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+
+def memoize_two_tier(
+    name: str, expire: int, max_size: int = 512
+) -> Callable[[Callable], Callable]:
+    """Memoize in process memory (L1) in front of the disk cache (L2).
+
+    Hot keys are served from memory without a SQLite read and unpickle;
+    disk hits are promoted to L1. None results (failed lookups) are not
+    cached, so a transient provider error isn't replayed for a day.
+
+    Args:
+        name: Key prefix, unique per decorated function.
+        expire: Time to live in seconds for both tiers.
+        max_size: Maximum number of L1 entries.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        l1 = TTLCache(max_size)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (name, args, tuple(sorted(kwargs.items())))
+            value = l1.get(key)
+            if value is not None:
+                return value
+            value = cache.get(key)
+            if value is None:
+                value = func(*args, **kwargs)
+                if value is None:
+                    return None
+                cache.set(key, value, expire=expire)
+            l1.set(key, value, expire)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -33,7 +33,15 @@ except Exception:
     # Fall back to raw URL if parsing fails.
     db_url = settings.database_url
 
-engine = create_async_engine(db_url, echo=settings.debug, connect_args=connect_args)
+engine = create_async_engine(
+    db_url,
+    echo=settings.debug,
+    connect_args=connect_args,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=settings.db_pool_recycle,
+)
 
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
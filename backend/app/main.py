@@ -1,15 +1,59 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.sessions import SessionMiddleware
 
+from app.agent.ai_client import (
+    HTTP_WARM_UP_INTERVAL,
+    close_http_client,
+    warm_up_http_client,
+)
+from app.agent.web_search import close_search_client
 from app.api.v1 import api_router
+from app.api.v1.trip_streaming import close_stream_executor
 from app.config import get_settings
 
 settings = get_settings()
 
+
+async def _keep_http_client_warm() -> None:
+    """Periodically touch OpenRouter so an idle pool doesn't go cold.
+
+    Without this, the first request after a quiet minute pays a fresh
+    TCP + TLS handshake on its time-to-first-token.
+    """
+    while True:
+        await asyncio.sleep(HTTP_WARM_UP_INTERVAL)
+        await asyncio.to_thread(warm_up_http_client)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Agent turns block a thread on network I/O for their whole duration; the
+    # default executor (min(32, cpus + 4) threads) would queue concurrent
+    # trips behind each other instead of overlapping their LLM round-trips.
+    executor = ThreadPoolExecutor(
+        max_workers=settings.agent_worker_threads, thread_name_prefix="agent"
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    await asyncio.to_thread(warm_up_http_client)
+    keep_warm = asyncio.create_task(_keep_http_client_warm())
+    yield
+    keep_warm.cancel()
+    close_http_client()
+    close_search_client()
+    close_stream_executor()
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
 app = FastAPI(
-    title=settings.app_name, openapi_url=f"{settings.api_v1_str}/openapi.json"
+    title=settings.app_name,
+    openapi_url=f"{settings.api_v1_str}/openapi.json",
+    lifespan=lifespan,
 )
 
 # CORS Configuration
@@ -29,18 +73,23 @@ if settings.debug:
     cors_origins = ["*"]
 else:
     if settings.frontend_urls:
-        cors_origins = [
+        base_origins = [
             origin.strip()
             for origin in settings.frontend_urls.split(",")
             if origin.strip()
         ]
     elif settings.frontend_url:
-        cors_origins = [settings.frontend_url]
+        base_origins = [settings.frontend_url]
+    else:
+        base_origins = []
 
     # Always allow local development clients to hit production backend.
-    for local_origin in ("http://localhost:3000", "http://127.0.0.1:3000"):
-        if local_origin not in cors_origins:
-            cors_origins.append(local_origin)
+    # dict.fromkeys dedups while keeping the configured order.
+    cors_origins = list(
+        dict.fromkeys(
+            [*base_origins, "http://localhost:3000", "http://127.0.0.1:3000"]
+        )
+    )
 
 if cors_origins:
     app.add_middleware(
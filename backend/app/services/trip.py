@@ -117,14 +117,14 @@ async def _persist_state(
     await db.refresh(version)
 
 
-async def _store_message(
+def _add_message(
     db: AsyncSession,
     trip_id: UUID,
     role: str,
     content: str,
     phase: Optional[str] = None,
 ) -> None:
-    """Persist a chat message for a trip."""
+    """Stage a chat message for a trip; it is written on the next commit."""
     if not content.strip():
         return
     db.add(
@@ -135,7 +135,24 @@ async def _store_message(
             phase=phase,
         )
     )
-    await db.commit()
+
+
+async def persist_turn(
+    db: AsyncSession,
+    version: TripVersion,
+    agent: TravelAgent,
+    user_message: str,
+    assistant_message: str,
+) -> None:
+    """Persist one conversation turn: both messages plus the agent state.
+
+    Everything goes out in a single commit instead of one round-trip per
+    message, keeping the DB writes at the end of a turn to a minimum.
+    """
+    phase = agent.state.phase.value
+    _add_message(db, version.trip_id, "user", user_message, phase=phase)
+    _add_message(db, version.trip_id, "assistant", assistant_message, phase=phase)
+    await _persist_state(db, version, agent)
 
 
 # ---------------------------------------------------------------------------
@@ -170,19 +187,43 @@ async def start_trip_conversation(
     # Enforce plan limits for free users (1 session per 2 days)
     await _enforce_plan_limit(db, user_id)
 
-    # Fetch user's language preference
-    language_code = await get_user_language(db, user_id)
+    agent = await new_agent(db, user_id, vibe=vibe, on_status=on_status)
+
+    # AI call — run in thread pool so we don't block the event loop
+    message = await asyncio.to_thread(agent.start, prompt)
 
-    agent = TravelAgent(
+    return await open_trip_session(db, user_id, agent, prompt, message)
+
+
+async def new_agent(
+    db: AsyncSession,
+    user_id: UUID,
+    vibe: Optional[str] = None,
+    on_status: Optional[Callable[[str], None]] = None,
+) -> TravelAgent:
+    """Create a TravelAgent in the user's preferred language."""
+    language_code = await get_user_language(db, user_id)
+    return TravelAgent(
         api_key=settings.openrouter_api_key,
         on_status=on_status,
         language_code=language_code,
         vibe=vibe,
     )
 
-    # AI call — run in thread pool so we don't block the event loop
-    message = await asyncio.to_thread(agent.start, prompt)
 
+async def open_trip_session(
+    db: AsyncSession,
+    user_id: UUID,
+    agent: TravelAgent,
+    prompt: str,
+    message: str,
+) -> AgentResponse:
+    """Persist the first turn of a started agent and register its session.
+
+    Creates the Trip + first TripVersion (or a new version of an existing
+    trip for the same route). If origin/destination couldn't be extracted,
+    nothing is persisted and ``trip_id`` is ``None``.
+    """
     # If origin/destination couldn't be extracted, return early
     if not agent.state.origin or not agent.state.destination:
         return AgentResponse(phase=agent.state.phase.value, message=message)
@@ -224,27 +265,18 @@ async def start_trip_conversation(
             phase="clarification",
         )
         db.add(version)
+        _add_message(
+            db, existing_trip.id, "user", prompt, phase=agent.state.phase.value
+        )
+        _add_message(
+            db, existing_trip.id, "assistant", message, phase=agent.state.phase.value
+        )
         await db.commit()
         await db.refresh(existing_trip)
         await db.refresh(version)
 
         _agent_sessions[existing_trip.id] = agent
 
-        await _store_message(
-            db,
-            existing_trip.id,
-            "user",
-            prompt,
-            phase=agent.state.phase.value,
-        )
-        await _store_message(
-            db,
-            existing_trip.id,
-            "assistant",
-            message,
-            phase=agent.state.phase.value,
-        )
-
         return AgentResponse(
             trip_id=existing_trip.id,
             version_id=version.id,
@@ -254,6 +286,8 @@ async def start_trip_conversation(
 
     version = TripVersion(trip_id=trip.id, version_number=1, phase="clarification")
     db.add(version)
+    _add_message(db, trip.id, "user", prompt, phase=agent.state.phase.value)
+    _add_message(db, trip.id, "assistant", message, phase=agent.state.phase.value)
     await db.commit()
     await db.refresh(trip)
     await db.refresh(version)
@@ -261,21 +295,6 @@ async def start_trip_conversation(
     # Store live session
     _agent_sessions[trip.id] = agent
 
-    await _store_message(
-        db,
-        trip.id,
-        "user",
-        prompt,
-        phase=agent.state.phase.value,
-    )
-    await _store_message(
-        db,
-        trip.id,
-        "assistant",
-        message,
-        phase=agent.state.phase.value,
-    )
-
     return AgentResponse(
         trip_id=trip.id,
         version_id=version.id,
@@ -311,21 +330,7 @@ async def submit_clarification(
         agent.process_clarification, answers
     )
 
-    await _persist_state(db, version, agent)
-    await _store_message(
-        db,
-        trip_id,
-        "user",
-        answers,
-        phase=agent.state.phase.value,
-    )
-    await _store_message(
-        db,
-        trip_id,
-        "assistant",
-        message,
-        phase=agent.state.phase.value,
-    )
+    await persist_turn(db, version, agent, answers, message)
 
     return AgentResponse(
         trip_id=trip_id,
@@ -370,21 +375,7 @@ async def proceed_after_feasibility(
         message = await asyncio.to_thread(agent.proceed_to_assumptions)
         user_message = "Continue to planning."
 
-    await _persist_state(db, version, agent)
-    await _store_message(
-        db,
-        trip_id,
-        "user",
-        user_message,
-        phase=agent.state.phase.value,
-    )
-    await _store_message(
-        db,
-        trip_id,
-        "assistant",
-        message,
-        phase=agent.state.phase.value,
-    )
+    await persist_turn(db, version, agent, user_message, message)
 
     return AgentResponse(
         trip_id=trip_id,
@@ -431,7 +422,6 @@ async def confirm_trip_assumptions(
         additional_interests=additional_interests,
     )
 
-    await _persist_state(db, version, agent)
     if confirmed and not modifications and not additional_interests:
         user_message = "Assumptions look good."
     else:
@@ -441,20 +431,7 @@ async def confirm_trip_assumptions(
         if additional_interests:
             parts.append(additional_interests)
         user_message = " ".join(parts).strip() or "Update assumptions."
-    await _store_message(
-        db,
-        trip_id,
-        "user",
-        user_message,
-        phase=agent.state.phase.value,
-    )
-    await _store_message(
-        db,
-        trip_id,
-        "assistant",
-        message,
-        phase=agent.state.phase.value,
-    )
+    await persist_turn(db, version, agent, user_message, message)
 
     return AgentResponse(
         trip_id=trip_id,
@@ -491,21 +468,7 @@ async def refine_trip_plan(
 
     message = await asyncio.to_thread(agent.refine_plan, refinement_type)
 
-    await _persist_state(db, version, agent)
-    await _store_message(
-        db,
-        trip_id,
-        "user",
-        refinement_type,
-        phase=agent.state.phase.value,
-    )
-    await _store_message(
-        db,
-        trip_id,
-        "assistant",
-        message,
-        phase=agent.state.phase.value,
-    )
+    await persist_turn(db, version, agent, refinement_type, message)
 
     return AgentResponse(
         trip_id=trip_id,
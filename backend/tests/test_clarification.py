@@ -0,0 +1,60 @@
+"""Tests for local parsing of clarification answers."""
+
+import pytest
+
+from app.agent.models import ConversationState
+from app.agent.phases.clarification import _extract_constraints_heuristic
+
+
+def _state() -> ConversationState:
+    return ConversationState(origin="Mumbai", destination="Tokyo")
+
+
+@pytest.mark.parametrize(
+    ("answers", "travel_type"),
+    [
+        ("March, 7 days, solo, budget around $2000", "solo"),
+        ("In December for 2 weeks, just me, budget ₹1.5 lakh", "solo"),
+        ("March, 7 days, with my partner, $2000", "couple"),
+        ("March, 7 days, with my wife, mid-range", "couple"),
+        ("March, 7 days, family with kids, $2000", "family"),
+        ("March, 7 days, with friends, mid-range", "group"),
+    ],
+)
+def test_simple_answers_parse_locally(answers: str, travel_type: str) -> None:
+    constraints = _extract_constraints_heuristic(_state(), answers, None)
+    assert constraints is not None
+    assert constraints.solo_or_group == travel_type
+
+
+@pytest.mark.parametrize(
+    "answers",
+    [
+        # Negated travel type
+        "March, 7 days, not alone, $2000",
+        "March, 7 days, won't be solo, $2000",
+        # Details beyond the parsed fields
+        "March, 7 days, solo, $2000, love hiking and ramen",
+        # Ambiguous travel type
+        "March, 7 days, couple with kids, $2000",
+        # Missing field
+        "March, solo, $2000",
+    ],
+)
+def test_richer_answers_go_to_the_model(answers: str) -> None:
+    assert _extract_constraints_heuristic(_state(), answers, None) is None
+
+
+@pytest.mark.parametrize(
+    ("answers", "duration_days"),
+    [
+        ("March, 7 days, solo, $2000", 7),
+        ("March, 2 weeks, solo, $2000", 14),
+        # N nights span N + 1 calendar days
+        ("March, 5 nights, solo, $2000", 6),
+    ],
+)
+def test_duration_units(answers: str, duration_days: int) -> None:
+    constraints = _extract_constraints_heuristic(_state(), answers, None)
+    assert constraints is not None
+    assert constraints.duration_days == duration_days
@@ -0,0 +1,45 @@
+"""Tests for the planning research heuristics."""
+
+import pytest
+
+from app.agent.models import ConversationState, TravelConstraints
+from app.agent.phases.planning import _needs_research
+
+FEASIBILITY = "Travel advisories: no warnings for Tokyo. " * 20
+PRICED = "Ghibli Museum tickets cost ¥1,000; sushi counters from ¥3,000. " * 10
+
+
+def _state(budget: str = "¥200,000") -> ConversationState:
+    state = ConversationState(origin="Osaka", destination="Tokyo")
+    state.constraints = TravelConstraints(
+        origin="Osaka", destination="Tokyo", budget=budget
+    )
+    return state
+
+
+@pytest.mark.parametrize(
+    ("search_results", "user_interests", "budget", "expected"),
+    [
+        # Nothing researched yet
+        ([], ["ghibli museum"], "¥200,000", True),
+        # Latest result too short to rely on
+        (["¥1,000 ghibli"], ["ghibli museum"], "¥200,000", True),
+        # No interests to check coverage against
+        ([FEASIBILITY, PRICED], [], "¥200,000", True),
+        # Interests not mentioned in the latest result
+        ([PRICED, FEASIBILITY], ["ghibli museum"], "¥200,000", True),
+        # Interests covered, but no prices in the budget currency
+        ([FEASIBILITY, PRICED], ["ghibli museum"], "$2000", True),
+        # Interests covered with prices in the budget currency
+        ([FEASIBILITY, PRICED], ["ghibli museum"], "¥200,000", False),
+    ],
+)
+def test_needs_research(
+    search_results: list[str],
+    user_interests: list[str],
+    budget: str,
+    expected: bool,
+) -> None:
+    assert (
+        _needs_research(_state(budget), search_results, user_interests) is expected
+    )
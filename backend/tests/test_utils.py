@@ -0,0 +1,32 @@
+"""Tests for agent utility helpers."""
+
+import pytest
+
+from app.agent.models import ConversationState
+from app.agent.utils import detect_budget_currency
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("Rs50000", "INR"),
+        ("INR50000", "INR"),
+        ("around 3 lakhs", "INR"),
+        ("₹80,000", "INR"),
+        ("usd 2000 (~₹1.6 lakh)", "INR"),
+        ("EUR2000", "EUR"),
+        ("900 euros", "EUR"),
+        ("A$3000", "AUD"),
+        ("c$1200", "CAD"),
+        ("S$ 800", "SGD"),
+        ("US$ 500", "USD"),
+        ("ideas$ 500", "USD"),
+        ("10000 yen", "JPY"),
+        ("£500", "GBP"),
+        ("1000 baht", "THB"),
+        ("2 hours a day", "USD"),
+        ("moderate", "USD"),
+    ],
+)
+def test_detect_budget_currency(text: str, expected: str) -> None:
+    assert detect_budget_currency(ConversationState(), text) == expected
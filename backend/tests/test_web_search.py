@@ -0,0 +1,99 @@
+"""Tests for web search query normalization, single-flight and memoization."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from app import cache as cache_module
+from app.agent import web_search
+from app.cache import memoize_two_tier
+
+RESULTS = [{"title": "Tokyo weather", "url": "https://example.com", "snippet": "Mild"}]
+
+
+class FakeDiskCache:
+    """In-memory stand-in for the diskcache tier."""
+
+    def __init__(self) -> None:
+        self.data: dict[Any, Any] = {}
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def set(self, key: Any, value: Any, expire: float | None = None) -> None:
+        self.data[key] = value
+
+
+@pytest.fixture(autouse=True)
+def fake_disk_cache(monkeypatch: pytest.MonkeyPatch) -> FakeDiskCache:
+    fake = FakeDiskCache()
+    monkeypatch.setattr(cache_module, "cache", fake)
+    return fake
+
+
+def test_concurrent_identical_queries_share_one_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+    release = threading.Event()
+
+    def slow_search(query: str, num_results: int) -> list[dict[str, str]]:
+        calls.append(query)
+        release.wait(timeout=5)
+        return RESULTS
+
+    monkeypatch.setattr(web_search, "_search_with_failover", slow_search)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        first = pool.submit(web_search.web_search, "tokyo weather")
+        while not calls:
+            time.sleep(0.01)
+        # The lookup is now in flight; the rest should join it
+        others = [
+            pool.submit(web_search.web_search, "tokyo weather") for _ in range(3)
+        ]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(timeout=5) for future in [first, *others]]
+
+    assert calls == ["tokyo weather"]
+    assert all(result == RESULTS for result in results)
+    assert not web_search._inflight
+
+
+def test_failed_lookups_are_not_cached(fake_disk_cache: FakeDiskCache) -> None:
+    outcomes = iter([None, RESULTS])
+    calls = 0
+
+    @memoize_two_tier("test-none", expire=60)
+    def lookup(query: str) -> list[dict[str, str]] | None:
+        nonlocal calls
+        calls += 1
+        return next(outcomes)
+
+    assert lookup("tokyo") is None
+    assert not fake_disk_cache.data
+    assert lookup("tokyo") == RESULTS
+    assert lookup("tokyo") == RESULTS
+    assert calls == 2
+
+
+def test_case_and_whitespace_variants_share_one_entry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    @memoize_two_tier("test-tavily", expire=60)
+    def fake_tavily(query: str, num_results: int = 5) -> list[dict[str, str]]:
+        calls.append(query)
+        return RESULTS
+
+    monkeypatch.setattr(web_search, "tavily_search", fake_tavily)
+
+    assert web_search.web_search("Tokyo  Weather ") == RESULTS
+    assert web_search.web_search("tokyo weather") == RESULTS
+    assert web_search.web_search("TOKYO\tweather") == RESULTS
+    assert calls == ["tokyo weather"]
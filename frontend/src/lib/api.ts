@@ -503,10 +503,7 @@ export async function startTripTokenStream(
   prompt: string,
   vibe?: string,
 ): Promise<AsyncGenerator<StreamEvent, void, void>> {
-  // backend currently doesn't have /start/token-stream, 
-  // but it has /start/stream which chunks text.
-  // For consistency, let's use the available stream endpoints.
-  return streamFetch("/trips/start/stream", { prompt, vibe });
+  return streamFetch("/trips/start/token-stream", { prompt, vibe });
 }
 
 export async function clarifyTripTokenStream(